@@ -7,37 +7,94 @@ Supports the processed job URLs format from url_fetcher.py output.
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
 import os
 import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set
 from urllib.parse import urlparse
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
-import socket
+
+import aiohttp
+
+try:
+    import brotli  # noqa: F401  (lets aiohttp decode "br" responses)
+
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+# Seconds an idle pooled connection is kept open for reuse
+KEEPALIVE_TIMEOUT = 30
+# Seconds resolved host addresses are cached by the connector
+DNS_CACHE_TTL = 300
+# Bytes read from the response body per write when streaming pages to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Maps path separators and characters invalid in filenames to underscores
+_FILENAME_TRANSLATION = str.maketrans(dict.fromkeys('/<>:"|?*', "_"))
+
+
+class AsyncTokenBucket:
+    """Token-bucket rate limiter shared by the asyncio download workers."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second (i.e. sustained requests per second)
+            capacity: Maximum number of tokens that can accumulate for a burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
 
 
 class HTMLDownloader:
     """Downloads HTML content from URLs and saves to files."""
 
     def __init__(
-        self, html_dump_dir: str, delay: float = 1.0, timeout: int = 30, max_retries: int = 3
+        self,
+        html_dump_dir: str,
+        delay: float = 1.0,
+        timeout: int = 30,
+        max_retries: int = 3,
+        concurrency: int = 10,
     ):
         """
         Initialize the HTML downloader.
 
         Args:
             html_dump_dir: Directory to save HTML files
-            delay: Delay between requests in seconds (default: 1.0)
+            delay: Minimum interval between requests to the same host in seconds
+                (default: 1.0)
             timeout: Request timeout in seconds (default: 30)
             max_retries: Maximum number of retry attempts (default: 3)
+            concurrency: Maximum number of downloads in flight (default: 10)
         """
         self.html_dump_dir = Path(html_dump_dir)
         self.delay = delay
         self.timeout = timeout
         self.max_retries = max_retries
+        self.concurrency = concurrency
+        self._rate_limiters: Dict[str, AsyncTokenBucket] = {}
         self.html_dump_dir.mkdir(parents=True, exist_ok=True)
 
         # User agent to avoid being blocked
@@ -45,7 +102,10 @@ class HTMLDownloader:
 
     def sanitize_filename(self, url: str, job_id: Optional[str] = None) -> str:
         """
-        Create a safe filename from URL and job ID.
+        Create a safe, fixed-length filename from URL and job ID.
+
+        The URL is hashed with BLAKE2b rather than embedded verbatim, so deep URL
+        paths can't run into filesystem name-length limits.
 
         Args:
             url: The URL to create filename from
@@ -54,82 +114,204 @@ class HTMLDownloader:
         Returns:
             Sanitized filename
         """
-        parsed = urlparse(url)
+        url_hash = hashlib.blake2b(url.encode("utf-8"), digest_size=12).hexdigest()
 
         if job_id:
-            base_name = f"{job_id}_{parsed.path.replace('/', '_')}"
-        else:
-            base_name = parsed.path.replace("/", "_")
+            # Replace path separators and invalid filename characters in one pass
+            safe_job_id = str(job_id).translate(_FILENAME_TRANSLATION).strip("_")
+            return f"{safe_job_id}_{url_hash}.html"
+        return f"{url_hash}.html"
 
-        # Remove invalid characters for filenames
-        invalid_chars = '<>:"|?*'
-        for char in invalid_chars:
-            base_name = base_name.replace(char, "_")
+    @staticmethod
+    def _legacy_filename(url: str, job_id: Optional[str] = None) -> str:
+        """
+        Build the filename pages were saved under before names were hashed.
 
-        # Remove leading/trailing underscores and ensure .html extension
-        base_name = base_name.strip("_")
+        Only used to recognise dumps from earlier runs, so upgrading does not
+        download every page again.
+        """
+        path = urlparse(url).path.replace("/", "_")
+        base_name = f"{job_id}_{path}" if job_id else path
+        base_name = base_name.translate(_FILENAME_TRANSLATION).strip("_")
         if not base_name.endswith(".html"):
             base_name += ".html"
-
         return base_name
 
-    def download_html(self, url: str) -> Optional[str]:
+    def _rate_limiter_for(self, url: str) -> Optional[AsyncTokenBucket]:
+        """Get the token bucket for the URL's host, or None if unthrottled."""
+        if self.delay <= 0:
+            return None
+        host = urlparse(url).netloc
+        limiter = self._rate_limiters.get(host)
+        if limiter is None:
+            limiter = self._rate_limiters[host] = AsyncTokenBucket(rate=1 / self.delay)
+        return limiter
+
+    async def download_to(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        filepath: Path,
+        throttle_first_attempt: bool = True,
+    ) -> bool:
         """
-        Download HTML content from a URL with retry logic.
+        Download a URL straight to disk with retry logic.
+
+        The response body is streamed in chunks into a temporary ``.part`` file
+        which is renamed into place once complete, so a failed download never
+        leaves a truncated page behind.
 
         Args:
+            session: Shared aiohttp client session
             url: URL to download
+            filepath: Destination file for the HTML content
+            throttle_first_attempt: Take a rate limiter token before the first attempt;
+                False when the caller already took it
 
         Returns:
-            HTML content as string, or None if failed after all retries
+            True if the page was saved, False if failed after all retries
         """
         last_exception = None
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        partial_path = filepath.with_name(filepath.name + ".part")
+        rate_limiter = self._rate_limiter_for(url)
 
         for attempt in range(self.max_retries + 1):
             try:
-                request = Request(url, headers={"User-Agent": self.user_agent})
-                with urlopen(request, timeout=self.timeout) as response:
-                    content = response.read().decode("utf-8", errors="ignore")
+                # Throttle per host; workers hitting other hosts are not held up
+                if rate_limiter and (attempt > 0 or throttle_first_attempt):
+                    await rate_limiter.acquire()
+                async with session.get(url, timeout=timeout) as response:
+                    response.raise_for_status()
+                    with open(partial_path, "wb") as f:
+                        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                    partial_path.replace(filepath)
                     if attempt > 0:
                         print(f"  Success on attempt {attempt + 1}")
-                    return content
+                    return True
 
-            except socket.timeout:
+            except asyncio.TimeoutError:
                 last_exception = f"Timeout after {self.timeout}s"
                 if attempt < self.max_retries:
                     wait_time = 2**attempt  # Exponential backoff: 1s, 2s, 4s
                     print(f"  Timeout on attempt {attempt + 1}, retrying in {wait_time}s...")
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
 
-            except HTTPError as e:
-                last_exception = f"HTTP {e.code}: {e.reason}"
-                if e.code >= 500 and attempt < self.max_retries:  # Retry on server errors
+            except aiohttp.ClientResponseError as e:
+                last_exception = f"HTTP {e.status}: {e.message}"
+                if e.status >= 500 and attempt < self.max_retries:  # Retry on server errors
                     wait_time = 2**attempt
                     print(f"  Server error on attempt {attempt + 1}, retrying in {wait_time}s...")
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                 else:
                     break  # Don't retry on client errors (4xx)
 
-            except URLError as e:
-                last_exception = f"URL error: {e.reason}"
+            except aiohttp.ClientError as e:
+                last_exception = f"URL error: {e}"
                 if attempt < self.max_retries:
                     wait_time = 2**attempt
                     print(f"  Network error on attempt {attempt + 1}, retrying in {wait_time}s...")
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                 else:
                     break
 
+            except OSError as e:
+                last_exception = f"Error saving {filepath.name}: {e}"
+                break  # Local filesystem errors won't be fixed by retrying
+
             except Exception as e:
                 last_exception = f"Unexpected error: {e}"
                 if attempt < self.max_retries:
                     wait_time = 2**attempt
                     print(f"  Error on attempt {attempt + 1}, retrying in {wait_time}s...")
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                 else:
                     break
 
+        partial_path.unlink(missing_ok=True)
         print(f"Error downloading {url}: {last_exception}", file=sys.stderr)
-        return None
+        return False
+
+    async def _download_job(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        existing_files: Set[str],
+        index: int,
+        total_jobs: int,
+        job: Dict[str, Any],
+    ) -> bool:
+        """
+        Download a single job page while holding a concurrency slot.
+
+        Returns:
+            True if the page is on disk afterwards, False otherwise
+        """
+        url = job.get("url")
+        job_id = job.get("job_id", "")
+
+        if not url:
+            print(f"Skipping job {index}: No URL found", file=sys.stderr)
+            return False
+
+        # Generate filename
+        filename = self.sanitize_filename(url, job_id)
+        filepath = self.html_dump_dir / filename
+
+        # Skip if file already exists, also under the naming used before hashing
+        if filename in existing_files:
+            print(f"  Skipping: File already exists - {filename}")
+            return True
+        legacy_filename = self._legacy_filename(url, job_id)
+        if legacy_filename in existing_files:
+            print(f"  Skipping: File already exists - {legacy_filename}")
+            return True
+
+        # Wait for the per-host token before taking a concurrency slot, so workers
+        # throttled on one host do not hold slots needed by other hosts
+        rate_limiter = self._rate_limiter_for(url)
+        if rate_limiter:
+            await rate_limiter.acquire()
+
+        async with semaphore:
+            print(f"[{index}/{total_jobs}] Downloading: {url}")
+            saved = await self.download_to(session, url, filepath, throttle_first_attempt=False)
+
+        if saved:
+            existing_files.add(filename)
+            print(f"  Saved: {filename}")
+        return saved
+
+    async def _download_jobs(self, jobs: List[Dict[str, Any]]) -> List[bool]:
+        """Download all job pages concurrently, bounded by ``self.concurrency``."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        total_jobs = len(jobs)
+        # Token buckets hold asyncio locks bound to the running loop, and every run
+        # gets its own loop from asyncio.run, so start each run with fresh ones
+        self._rate_limiters = {}
+
+        # Scan the dump directory once instead of stat-ing every target file
+        with os.scandir(self.html_dump_dir) as entries:
+            existing_files = {entry.name for entry in entries}
+
+        # One pooled connector for the whole run so sockets (and resolved DNS entries)
+        # are kept alive and reused across downloads instead of reconnecting per URL.
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        )
+        # Ask for compressed pages; aiohttp transparently decodes them while streaming
+        headers = {"User-Agent": self.user_agent, "Accept-Encoding": ACCEPT_ENCODING}
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            tasks = [
+                asyncio.create_task(
+                    self._download_job(session, semaphore, existing_files, i, total_jobs, job)
+                )
+                for i, job in enumerate(jobs, 1)
+            ]
+            return await asyncio.gather(*tasks)
 
     def process_urls_from_json(self, url_source_file: str) -> None:
         """
@@ -154,48 +336,9 @@ class HTMLDownloader:
         total_jobs = len(jobs)
         print(f"Found {total_jobs} URLs to download")
 
-        success_count = 0
-        failed_count = 0
-
-        for i, job in enumerate(jobs, 1):
-            url = job.get("url")
-            job_id = job.get("job_id", "")
-
-            if not url:
-                print(f"Skipping job {i}: No URL found", file=sys.stderr)
-                failed_count += 1
-                continue
-
-            print(f"[{i}/{total_jobs}] Downloading: {url}")
-
-            # Generate filename
-            filename = self.sanitize_filename(url, job_id)
-            filepath = self.html_dump_dir / filename
-
-            # Skip if file already exists
-            if filepath.exists():
-                print(f"  Skipping: File already exists - {filename}")
-                success_count += 1
-                continue
-
-            # Download HTML content
-            html_content = self.download_html(url)
-
-            if html_content:
-                try:
-                    with open(filepath, "w", encoding="utf-8") as f:
-                        f.write(html_content)
-                    print(f"  Saved: {filename}")
-                    success_count += 1
-                except IOError as e:
-                    print(f"  Error saving {filename}: {e}", file=sys.stderr)
-                    failed_count += 1
-            else:
-                failed_count += 1
-
-            # Add delay between requests to be respectful
-            if i < total_jobs:
-                time.sleep(self.delay)
+        results = asyncio.run(self._download_jobs(jobs))
+        success_count = sum(results)
+        failed_count = total_jobs - success_count
 
         print("\nDownload complete:")
         print(f"  Successful: {success_count}")
@@ -217,7 +360,10 @@ def main():
         "--html-dump-dir", required=True, help="Directory to save downloaded HTML files"
     )
     parser.add_argument(
-        "--delay", type=float, default=1.0, help="Delay between requests in seconds (default: 1.0)"
+        "--delay",
+        type=float,
+        default=1.0,
+        help="Minimum delay between requests to the same host in seconds (default: 1.0)",
     )
     parser.add_argument(
         "--timeout", type=int, default=30, help="Request timeout in seconds (default: 30)"
@@ -225,6 +371,12 @@ def main():
     parser.add_argument(
         "--max-retries", type=int, default=3, help="Maximum number of retry attempts (default: 3)"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Maximum number of concurrent downloads (default: 10)",
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
 
     args = parser.parse_args()
@@ -235,7 +387,9 @@ def main():
         sys.exit(1)
 
     # Create downloader and process URLs
-    downloader = HTMLDownloader(args.html_dump_dir, args.delay, args.timeout, args.max_retries)
+    downloader = HTMLDownloader(
+        args.html_dump_dir, args.delay, args.timeout, args.max_retries, args.concurrency
+    )
     downloader.process_urls_from_json(args.url_source_file)
 
 
@@ -9,22 +9,68 @@ This script processes the output from url_fetcher.py to:
 4. Filter out invalid URLs
 """
 
-import json
+import functools
+import os
 import re
 import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import IO, Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import click
+import ijson
+import orjson
 import yaml
 
+try:
+    # libyaml-backed loader, much faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    # Optional linear-time regex engine, selected with ``regex_engine: re2``
+    import re2
+except ImportError:
+    re2 = None
+
+# Extracted URL fields copied to the top level of each processed job
+PROMOTED_FIELDS = frozenset({"job_id", "team", "job_title"})
+
+# Number of URLs sent to a validation worker per task
+VALIDATION_CHUNK_SIZE = 1000
+
+# Validation config of the current worker process, set by _init_validation_worker
+_worker_validation_config: Dict[str, Any] = {}
+
+# ijson events carrying a scalar value
+_SCALAR_EVENTS = frozenset({"string", "number", "boolean", "null"})
+
 
 def load_pattern_config(pattern_file: Path) -> Dict[str, Any]:
-    """Load and validate pattern configuration from YAML file."""
+    """
+    Load and validate pattern configuration from YAML file.
+
+    Results are cached by path and modification time, so reloading an unchanged
+    file skips both YAML parsing and regex compilation. The returned dict is
+    shared between callers and must not be mutated.
+    """
+    try:
+        mtime_ns = os.stat(pattern_file).st_mtime_ns
+    except FileNotFoundError as e:
+        raise ValueError(f"Pattern file not found: {pattern_file}") from e
+    return _load_pattern_config_cached(str(pattern_file), mtime_ns)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_pattern_config_cached(pattern_file: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse and compile a pattern file; ``mtime_ns`` only serves as cache key."""
     try:
         with open(pattern_file, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YamlLoader)
 
         # Validate required fields for post-processing
         required_fields = ["url_validation"]
@@ -32,18 +78,82 @@ def load_pattern_config(pattern_file: Path) -> Dict[str, Any]:
             if field not in config:
                 raise ValueError(f"Missing required field '{field}' in pattern configuration")
 
+        config["url_validation"] = compile_validation_config(config["url_validation"] or {})
         return config
 
     except yaml.YAMLError as e:
-        raise ValueError(f"Invalid YAML format: {e}")
-    except FileNotFoundError:
-        raise ValueError(f"Pattern file not found: {pattern_file}")
+        raise ValueError(f"Invalid YAML format: {e}") from e
+    except re.error as e:
+        raise ValueError(f"Invalid URL validation pattern: {e}") from e
+    except FileNotFoundError as e:
+        raise ValueError(f"Pattern file not found: {pattern_file}") from e
+
+
+def compile_validation_config(validation_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compile the regex patterns of a ``url_validation`` section once up front.
+
+    All ``invalid_patterns`` are fused into a single alternation so each URL is
+    scanned once, no matter how many exclusion patterns are configured.
+
+    Patterns are compiled with the engine named by the optional ``regex_engine``
+    key (``re`` by default, or ``re2``).
+
+    Returns:
+        Copy of the section with ``valid_pattern`` as a compiled pattern,
+        ``invalid_pattern`` as the fused exclusion pattern (either may be None)
+        and ``extracted_defaults`` mapping each required field to ""
+    """
+    compiled = dict(validation_config)
+    compile_pattern = _pattern_compiler(compiled.pop("regex_engine", "re"))
+
+    valid_pattern = validation_config.get("valid_pattern", "")
+    compiled["valid_pattern"] = compile_pattern(valid_pattern) if valid_pattern else None
+
+    compiled["extracted_defaults"] = dict.fromkeys(compiled.get("extracted_fields") or [], "")
+
+    invalid_patterns = compiled.pop("invalid_patterns", None) or []
+    compiled["invalid_pattern"] = (
+        compile_pattern("|".join(f"(?:{pattern})" for pattern in invalid_patterns))
+        if invalid_patterns
+        else None
+    )
+    return compiled
+
+
+def _pattern_compiler(regex_engine: str) -> Callable[[str], Any]:
+    """
+    Return the compile function of the configured regex engine.
+
+    ``re2`` guarantees linear-time matching, which bounds the cost of hostile or
+    pathological URLs, but its Python binding is slower per call than ``re`` and
+    it rejects backreferences and lookaround.
+    """
+    if regex_engine == "re":
+        return re.compile
+    if regex_engine != "re2":
+        raise ValueError(f"Unknown regex_engine '{regex_engine}', expected 're' or 're2'")
+    if re2 is None:
+        raise ValueError("regex_engine 're2' requires the google-re2 package")
+
+    def compile_re2(pattern: str) -> Any:
+        try:
+            return re2.compile(pattern)
+        except re2.error as e:
+            raise ValueError(f"Invalid URL validation pattern for re2: {e}") from e
+
+    return compile_re2
 
 
 def validate_url(url: str, validation_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Validate a job URL against the configured patterns and extract metadata.
 
+    Args:
+        url: Job URL to validate
+        validation_config: URL validation configuration, as compiled by
+            ``compile_validation_config``
+
     Returns:
         Dict with extracted fields if valid, None if invalid
     """
@@ -51,22 +161,21 @@ def validate_url(url: str, validation_config: Dict[str, Any]) -> Optional[Dict[s
         return None
 
     # Check against invalid patterns first
-    invalid_patterns = validation_config.get("invalid_patterns", [])
-    for pattern in invalid_patterns:
-        if re.search(pattern, url):
-            return None
+    invalid_pattern = validation_config.get("invalid_pattern")
+    if invalid_pattern and invalid_pattern.search(url):
+        return None
 
     # Check against valid pattern and extract fields
-    valid_pattern = validation_config.get("valid_pattern", "")
+    valid_pattern = validation_config.get("valid_pattern")
     if not valid_pattern:
         return None
 
-    match = re.match(valid_pattern, url)
+    match = valid_pattern.match(url)
     if not match:
         return None
 
-    # Extract fields from the URL
-    extracted_data = match.groupdict()
+    # Extract fields from the URL, defaulting required fields the pattern lacks
+    extracted_data = {**validation_config.get("extracted_defaults", {}), **match.groupdict()}
 
     # Clean up job title (URL decode and format)
     if "job_title" in extracted_data and extracted_data["job_title"]:
@@ -75,95 +184,249 @@ def validate_url(url: str, validation_config: Dict[str, Any]) -> Optional[Dict[s
         job_title = job_title.replace("-", " ").title()
         extracted_data["job_title"] = job_title
 
-    # Ensure all required fields are present
-    extracted_fields = validation_config.get("extracted_fields", [])
-    for field in extracted_fields:
-        if field not in extracted_data:
-            extracted_data[field] = ""
-
     return extracted_data
 
 
-def process_jobs(input_data: Dict[str, Any], validation_config: Dict[str, Any]) -> Dict[str, Any]:
+def iter_input_jobs(f: IO[bytes], header: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
     """
-    Process job URLs to validate, extract metadata, and deduplicate.
+    Stream job entries out of url_fetcher.py output one at a time.
+
+    Top-level scalar fields (``source_url``, ``company_name``, ...) are collected
+    into ``header`` as they are encountered, so it is only complete once the
+    iterator has been exhausted.
 
     Args:
-        input_data: Raw data from url_fetcher.py
-        validation_config: URL validation configuration
+        f: Input JSON file opened in binary mode
+        header: Dict to fill with the top-level scalar fields
 
-    Returns:
-        Processed data with validated and deduplicated jobs
+    Yields:
+        Raw job dicts from the ``jobs`` array
     """
-    original_jobs = input_data.get("jobs", [])
-    processed_jobs = []
-    seen_job_ids: Set[str] = set()
-
-    stats = {
-        "original_count": len(original_jobs),
+    builder = None
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if prefix == "jobs.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "jobs.item" and event == "end_map":
+                yield builder.value
+                builder = None
+        elif prefix and "." not in prefix and event in _SCALAR_EVENTS:
+            header[prefix] = value
+
+
+def new_processing_stats() -> Dict[str, int]:
+    """Create the counters updated by ``iter_processed_jobs``."""
+    return {
+        "original_count": 0,
         "valid_count": 0,
         "invalid_count": 0,
         "duplicate_count": 0,
         "final_count": 0,
     }
 
-    for job in original_jobs:
-        url = job.get("url", "")
-
-        # Validate URL and extract metadata
-        validation_result = validate_url(url, validation_config)
-
-        if validation_result is None:
-            stats["invalid_count"] += 1
-            continue
-
-        stats["valid_count"] += 1
-
-        # Check for duplicates by job_id
-        job_id = validation_result.get("job_id", "")
-        if job_id in seen_job_ids:
-            stats["duplicate_count"] += 1
-            continue
-
-        if job_id:
-            seen_job_ids.add(job_id)
-
-        # Create processed job entry
-        processed_job = {
-            "url": url,
-            "job_id": validation_result.get("job_id", ""),
-            "team": validation_result.get("team", ""),
-            "job_title": validation_result.get("job_title", ""),
-            "title": job.get("title", ""),  # Keep original title if available
-            "location": job.get("location", ""),
-            "department": job.get("department", ""),
-            "job_type": job.get("job_type", ""),
-            "posted_date": job.get("posted_date", ""),
-            "company": job.get("company", ""),
-            "source_url": job.get("source_url", ""),
-            "metadata": job.get("metadata", {}),
-            "extracted_fields": validation_result,
-        }
-
-        processed_jobs.append(processed_job)
-
-    stats["final_count"] = len(processed_jobs)
-
-    # Create output data structure
-    output_data = {
-        "source_url": input_data.get("source_url", ""),
+
+def _init_validation_worker(validation_config: Dict[str, Any]) -> None:
+    """Store the validation config once per worker process."""
+    global _worker_validation_config
+    _worker_validation_config = validation_config
+
+
+def _validate_urls(urls: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """Validate a chunk of URLs inside a worker process."""
+    return [validate_url(url, _worker_validation_config) for url in urls]
+
+
+def iter_validation_results(
+    jobs: Iterable[Dict[str, Any]], validation_config: Dict[str, Any], workers: int = 1
+) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+    """
+    Pair each job with the result of validating its URL.
+
+    With more than one worker, URLs are validated in chunks on a process pool.
+    Only a bounded number of chunks is in flight at a time, so the input is still
+    streamed, and results are yielded in input order.
+
+    Args:
+        jobs: Raw job dicts from url_fetcher.py
+        validation_config: Compiled URL validation configuration
+        workers: Number of worker processes (1 validates in-process)
+
+    Yields:
+        ``(job, validation_result)`` tuples
+    """
+    if workers <= 1:
+        for job in jobs:
+            yield job, validate_url(job.get("url", ""), validation_config)
+        return
+
+    job_iter = iter(jobs)
+    pending: Deque[Tuple[List[Dict[str, Any]], Future]] = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_validation_worker,
+        initargs=(validation_config,),
+    ) as executor:
+        while True:
+            while len(pending) < workers * 2:
+                chunk = list(islice(job_iter, VALIDATION_CHUNK_SIZE))
+                if not chunk:
+                    break
+                urls = [job.get("url", "") for job in chunk]
+                pending.append((chunk, executor.submit(_validate_urls, urls)))
+
+            if not pending:
+                break
+
+            chunk, future = pending.popleft()
+            yield from zip(chunk, future.result())
+
+
+def iter_processed_jobs(
+    jobs: Iterable[Dict[str, Any]],
+    validation_config: Dict[str, Any],
+    stats: Dict[str, int],
+    workers: int = 1,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Validate, extract metadata from, and deduplicate a stream of jobs.
+
+    Deduplication always happens here in the calling process, so job IDs stay
+    globally unique even when validation is spread over workers.
+
+    Args:
+        jobs: Raw job dicts from url_fetcher.py
+        validation_config: Compiled URL validation configuration
+        stats: Counters from ``new_processing_stats``, updated when the stream ends
+        workers: Number of worker processes used for URL validation
+
+    Yields:
+        Processed job entries, in input order
+    """
+    seen_job_ids: Set[str] = set()
+
+    # Bind hot-loop names locally and count in locals, writing back to ``stats``
+    # once the stream ends (or is abandoned)
+    seen_add = seen_job_ids.add
+    promoted_fields = PROMOTED_FIELDS
+    original_count = invalid_count = duplicate_count = final_count = 0
+
+    try:
+        for job, validation_result in iter_validation_results(jobs, validation_config, workers):
+            original_count += 1
+
+            if validation_result is None:
+                invalid_count += 1
+                continue
+
+            # Check for duplicates by job_id
+            job_id = validation_result.get("job_id", "")
+            if job_id:
+                if job_id in seen_job_ids:
+                    duplicate_count += 1
+                    continue
+                seen_add(job_id)
+
+            job_get = job.get
+
+            # Create processed job entry
+            processed_job = {
+                "url": job_get("url", ""),
+                "job_id": job_id,
+                "team": validation_result.get("team", ""),
+                "job_title": validation_result.get("job_title", ""),
+                "title": job_get("title", ""),  # Keep original title if available
+                "location": job_get("location", ""),
+                "department": job_get("department", ""),
+                "job_type": job_get("job_type", ""),
+                "posted_date": job_get("posted_date", ""),
+                "company": job_get("company", ""),
+                "source_url": job_get("source_url", ""),
+                "metadata": job_get("metadata", {}),
+                # Only fields not already promoted to the top level above
+                "extracted_fields": {
+                    field: value
+                    for field, value in validation_result.items()
+                    if field not in promoted_fields
+                },
+            }
+
+            final_count += 1
+            yield processed_job
+    finally:
+        stats["original_count"] += original_count
+        stats["valid_count"] += original_count - invalid_count
+        stats["invalid_count"] += invalid_count
+        stats["duplicate_count"] += duplicate_count
+        stats["final_count"] += final_count
+
+
+def build_output_summary(header: Dict[str, Any], stats: Dict[str, int]) -> Dict[str, Any]:
+    """Build the top-level output fields that accompany the processed jobs."""
+    return {
+        "source_url": header.get("source_url", ""),
         "original_total_jobs": stats["original_count"],
         "processed_total_jobs": stats["final_count"],
         "processing_stats": stats,
         "processing_timestamp": datetime.now().isoformat(),
-        "company_name": input_data.get("company_name", ""),
-        "total_pages_crawled": input_data.get("total_pages_crawled", 0),
-        "jobs": processed_jobs,
+        "company_name": header.get("company_name", ""),
+        "total_pages_crawled": header.get("total_pages_crawled", 0),
     }
 
+
+def process_jobs(input_data: Dict[str, Any], validation_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Process job URLs to validate, extract metadata, and deduplicate.
+
+    In-memory counterpart of the streaming pipeline used by ``main``.
+
+    Args:
+        input_data: Raw data from url_fetcher.py
+        validation_config: Compiled URL validation configuration
+
+    Returns:
+        Processed data with validated and deduplicated jobs
+    """
+    stats = new_processing_stats()
+    processed_jobs = list(iter_processed_jobs(input_data.get("jobs", []), validation_config, stats))
+
+    output_data = build_output_summary(input_data, stats)
+    output_data["jobs"] = processed_jobs
     return output_data
 
 
+def write_processed_output(
+    f: IO[bytes], jobs: Iterable[Dict[str, Any]], summary_factory: Callable[[], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Write the processed output JSON incrementally as jobs stream in.
+
+    The ``jobs`` array is written first, one job per line, followed by the summary
+    fields, which are only known once every job has been processed.
+
+    Args:
+        f: Output file opened in binary mode
+        jobs: Processed job entries
+        summary_factory: Called after the last job to build the summary fields
+
+    Returns:
+        The summary fields that were written
+    """
+    f.write(b'{\n  "jobs": [')
+    separator = b"\n    "
+    for job in jobs:
+        f.write(separator)
+        f.write(orjson.dumps(job))
+        separator = b",\n    "
+    f.write(b"\n  ],")
+
+    summary = summary_factory()
+    # Reuse the indented dump of the summary, minus its opening brace
+    f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2)[1:])
+    f.write(b"\n")
+    return summary
+
+
 @click.command()
 @click.option(
     "--url-file",
@@ -183,6 +446,13 @@ def process_jobs(input_data: Dict[str, Any], validation_config: Dict[str, Any])
     type=click.Path(exists=True),
     help="YAML configuration file with URL validation patterns",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes for URL validation (1 validates in-process)",
+)
 @click.option(
     "--verbose",
     "-v",
@@ -193,6 +463,7 @@ def main(
     url_file: str,
     output_file: str,
     pattern_yaml: str,
+    workers: int,
     verbose: bool,
 ) -> None:
     """
@@ -211,29 +482,30 @@ def main(
         pattern_config = load_pattern_config(Path(pattern_yaml))
         validation_config = pattern_config.get("url_validation", {})
 
-        # Load input data
-        if verbose:
-            click.echo(f"Loading input data from {url_file}...")
-        with open(url_file, "r", encoding="utf-8") as f:
-            input_data = json.load(f)
-
-        if verbose:
-            click.echo(f"Found {len(input_data.get('jobs', []))} jobs to process")
-
-        # Process jobs
+        # Stream input jobs through processing straight into the output file
         if verbose:
+            click.echo(f"Streaming jobs from {url_file}...")
             click.echo("Processing and validating job URLs...")
-        output_data = process_jobs(input_data, validation_config)
 
-        # Save processed data
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        header: Dict[str, Any] = {}
+        stats = new_processing_stats()
+        # Stream into a temporary file next to the output and rename it into place once
+        # complete, so a failed run leaves any previous output untouched
+        partial_path = output_path.with_name(output_path.name + ".part")
+        try:
+            with open(url_file, "rb") as in_f, open(partial_path, "wb") as out_f:
+                jobs = iter_processed_jobs(
+                    iter_input_jobs(in_f, header), validation_config, stats, workers
+                )
+                write_processed_output(out_f, jobs, lambda: build_output_summary(header, stats))
+            os.replace(partial_path, output_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
 
         # Display results
-        stats = output_data["processing_stats"]
         click.echo("Processing complete!")
         click.echo(f"Original jobs: {stats['original_count']}")
         click.echo(f"Valid jobs: {stats['valid_count']}")
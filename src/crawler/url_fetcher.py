@@ -6,22 +6,316 @@ This script visits a company's career home page and extracts job posting URLs
 based on patterns defined in a YAML configuration file.
 """
 
-import json
+import asyncio
+import importlib.util
+import os
 import re
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse, parse_qs, urlencode
 
 import click
+import orjson
 import scrapy
 import yaml
 from scrapy.crawler import CrawlerProcess
 from scrapy.http import Request, Response
 
-# Global variable to store extraction results
-extraction_results = {}
+try:
+    # libyaml-backed loader, much faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    # Optional: scans a URL for all filter patterns in a single pass
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional: C HTML parser used for link-only selectors with ``html_parser: lexbor``
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Optional: libuv-based event loop for the asyncio reactor
+HAS_UVLOOP = importlib.util.find_spec("uvloop") is not None
+
+# Name of the browser context shared by all Playwright page requests
+PLAYWRIGHT_CONTEXT = "default"
+
+# Playwright resource types never needed to extract job links
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "stylesheet", "media"})
+
+# Page number in pagination links, e.g. "?page=3"
+PAGE_NUMBER_RE = re.compile(r"page=(\d+)")
+
+# Result range summaries such as "1-20 of 3380 results" or "1-20 of 3,380 results"
+RESULTS_RANGE_RE = re.compile(r"(\d[\d,]*)-(\d[\d,]*) of (\d[\d,]*)")
+
+# Substrings of lowercased URLs that rule out a job posting
+EXCLUDE_URL_PATTERNS = (
+    ".pdf",
+    ".jpg",
+    ".jpeg",
+    ".png",
+    ".gif",
+    "locationpicker",
+    "/apply/",
+    "/profile/",
+    "/search",
+    "/filter",
+    "javascript:",
+    "mailto:",
+    "tel:",
+    "#",
+)
+
+# Substrings of lowercased URLs that indicate a job posting
+JOB_URL_PATTERNS = (
+    "/job/",
+    "/jobs/",
+    "/career/",
+    "/careers/",
+    "/position/",
+    "/positions/",
+    "/opening/",
+    "/openings/",
+    "/details/",
+    "/listing/",
+    "/apply",
+)
+
+
+def _build_url_matcher(patterns: Tuple[str, ...]) -> Callable[[str], bool]:
+    """Return a function telling whether a string contains any of ``patterns``."""
+    if ahocorasick is None:
+        return lambda text: any(pattern in text for pattern in patterns)
+
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
+
+
+is_excluded_url = _build_url_matcher(EXCLUDE_URL_PATTERNS)
+has_job_url_pattern = _build_url_matcher(JOB_URL_PATTERNS)
+
+
+def should_abort_request(request) -> bool:
+    """Tell scrapy-playwright to skip downloading assets that only affect rendering."""
+    return request.resource_type in BLOCKED_RESOURCE_TYPES
+
+
+def _lexbor_attribute_values(tree, selector: str, attribute: str) -> List[Tuple[None, str]]:
+    """Read ``attribute`` from each element matching ``selector`` in a lexbor tree."""
+    # lexbor yields an element once per matching selector in a group, parsel only once
+    seen = set()
+    values = []
+    for node in tree.css(selector):
+        if node.mem_id not in seen:
+            seen.add(node.mem_id)
+            values.append((None, node.attributes.get(attribute)))
+    return values
+
+
+def _lookup(data: Any, path: str) -> Any:
+    """Follow a dotted path of keys and list indices (e.g. ``data.jobs.0``) into JSON data."""
+    for key in path.split(".") if path else []:
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+            data = data[int(key)]
+        else:
+            return None
+    return data
+
+
+class DomainTokenBucket:
+    """Token bucket pacing the requests sent to one domain."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second (i.e. sustained requests per second)
+            capacity: Maximum number of tokens that can accumulate for a burst
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.paused_until = 0.0
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class RateLimitMiddleware:
+    """
+    Downloader middleware pacing requests per domain with a token bucket.
+
+    Each domain gets ``RATE_LIMIT_PER_SECOND`` requests per second on average, with
+    bursts of up to ``RATE_LIMIT_BURST``. Servers that publish ``X-RateLimit-Remaining``
+    and ``X-RateLimit-Reset`` get their remaining quota spread over the reset window
+    (never faster than the configured rate), and ``Retry-After`` or an exhausted quota
+    pauses the domain. The ``SCRAPER_RATE_LIMIT_DELAY`` environment variable sets a
+    minimum delay in seconds between requests to a domain.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0):
+        min_delay = float(os.environ.get("SCRAPER_RATE_LIMIT_DELAY", 0) or 0)
+        if min_delay > 0:
+            rate = min(rate, 1 / min_delay)
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, DomainTokenBucket] = {}
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(
+            crawler.settings.getfloat("RATE_LIMIT_PER_SECOND", 0.2),
+            crawler.settings.getfloat("RATE_LIMIT_BURST", 1.0),
+        )
+
+    def _bucket_for(self, url: str) -> DomainTokenBucket:
+        domain = urlparse(url).netloc
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = self._buckets[domain] = DomainTokenBucket(self.rate, self.burst)
+        return bucket
+
+    async def process_request(self, request: Request, spider: scrapy.Spider) -> None:
+        await self._bucket_for(request.url).acquire()
+
+    def process_response(
+        self, request: Request, response: Response, spider: scrapy.Spider
+    ) -> Response:
+        bucket = self._bucket_for(request.url)
+        now = time.monotonic()
+
+        retry_after = _header_seconds(response, b"Retry-After")
+        if retry_after is not None and response.status in (429, 503):
+            bucket.paused_until = max(bucket.paused_until, now + retry_after)
+
+        remaining = _header_seconds(response, b"X-RateLimit-Remaining")
+        reset = _header_seconds(response, b"X-RateLimit-Reset")
+        if remaining is not None and reset is not None:
+            if reset > 1e9:
+                # Reset given as a Unix timestamp rather than seconds from now
+                reset = max(0.0, reset - time.time())
+            if remaining < 1:
+                bucket.paused_until = max(bucket.paused_until, now + reset)
+            elif reset > 0:
+                bucket.rate = min(bucket.max_rate, remaining / reset)
+            else:
+                bucket.rate = bucket.max_rate
+
+        return response
+
+
+def _header_seconds(response: Response, name: bytes) -> Optional[float]:
+    """Read a numeric response header, ignoring missing or malformed values."""
+    value = response.headers.get(name)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class JobItem(scrapy.Item):
+    """A job posting URL with the metadata found next to it."""
+
+    url = scrapy.Field()
+    title = scrapy.Field()
+    location = scrapy.Field()
+    department = scrapy.Field()
+    job_type = scrapy.Field()
+    posted_date = scrapy.Field()
+    company = scrapy.Field()
+    source_url = scrapy.Field()
+    metadata = scrapy.Field()
+
+
+class JobsJsonPipeline:
+    """
+    Write jobs to the output file as the spider finds them.
+
+    Each job is appended to a JSON Lines file next to the output file right away,
+    so an interrupted crawl keeps what it already extracted. When the crawl ends,
+    that file is streamed into the final JSON output after the summary fields.
+    """
+
+    def __init__(self, output_file: str):
+        self.output_path = Path(output_file)
+        self.stream_path = self.output_path.with_suffix(".jsonl")
+        self.stream = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(crawler.settings.get("JOBS_OUTPUT_FILE"))
+
+    def open_spider(self, spider: "JobUrlSpider") -> None:
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.stream = open(self.stream_path, "wb")
+
+        # Carry over the jobs of the previous crawl when restarting
+        for job_data in spider.existing_jobs:
+            self.stream.write(orjson.dumps(job_data) + b"\n")
+        self.stream.flush()
+        spider.existing_jobs = []
+
+    def process_item(self, item: JobItem, spider: "JobUrlSpider") -> JobItem:
+        self.stream.write(orjson.dumps(dict(item)) + b"\n")
+        self.stream.flush()
+        return item
+
+    def close_spider(self, spider: "JobUrlSpider") -> None:
+        self.stream.close()
+
+        summary = {
+            "source_url": spider.home_url,
+            "company_name": spider.pattern_config.get("company_name", ""),
+            "total_jobs": spider.jobs_count,
+            "total_pages_crawled": spider.pages_crawled,
+            "total_pages_attempted": spider.total_pages or "unknown",
+            "extraction_timestamp": datetime.now().isoformat(),
+        }
+        spider.extraction_summary = summary
+
+        # Write to a temporary file first so a failed write never truncates old output
+        part_path = self.output_path.with_suffix(".json.part")
+        with open(part_path, "wb") as f, open(self.stream_path, "rb") as jobs:
+            # Indented summary without its closing brace, followed by the jobs array
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2)[:-2])
+            f.write(b',\n  "jobs": [')
+            separator = b"\n    "
+            for line in jobs:
+                f.write(separator)
+                f.write(line.rstrip(b"\n"))
+                separator = b",\n    "
+            f.write(b"\n  ]\n}\n")
+        os.replace(part_path, self.output_path)
 
 
 class JobUrlSpider(scrapy.Spider):
@@ -42,8 +336,10 @@ class JobUrlSpider(scrapy.Spider):
         self.home_url = home_url
         self.pattern_config = pattern_config or {}
         self.restart_from_page = restart_from_page or 1
-        self.job_urls: List[Dict[str, Any]] = []
+        self.existing_jobs: List[Dict[str, Any]] = []  # Handed to JobsJsonPipeline
         self.unique_urls = set()  # Track unique URLs across all pages
+        self.jobs_count = 0
+        self.extraction_summary: Dict[str, Any] = {}  # Set by JobsJsonPipeline
         self.pages_crawled = 0
         self.total_pages = None
         self.pagination_config = self.pattern_config.get("pagination", {})
@@ -55,32 +351,64 @@ class JobUrlSpider(scrapy.Spider):
 
         # Load existing data if restarting
         if existing_data:
-            self.job_urls = existing_data.get("jobs", [])
-            self.unique_urls = {job["url"] for job in self.job_urls}
+            self.existing_jobs = existing_data.get("jobs", [])
+            self.unique_urls = {job["url"] for job in self.existing_jobs}
+            self.jobs_count = len(self.existing_jobs)
             self.pages_crawled = existing_data.get("total_pages_crawled", 0)
-            self.logger.info(f"Loaded {len(self.job_urls)} existing job URLs from previous crawl")
+            self.logger.info(f"Loaded {self.jobs_count} existing job URLs from previous crawl")
 
+        self._parsed_home_url = urlparse(home_url or "")
+        self._home_query_params = parse_qs(self._parsed_home_url.query)
         if home_url:
-            self.base_domain = urlparse(home_url).netloc
+            self.base_domain = self._parsed_home_url.netloc
+
+        self._use_lexbor = self.pattern_config.get("html_parser") == "lexbor"
+        if self._use_lexbor and LexborHTMLParser is None:
+            self.logger.warning("html_parser 'lexbor' needs selectolax, falling back to parsel")
+            self._use_lexbor = False
+
+        # Compile the page count pattern once rather than on every page
+        self._page_text_re = re.compile(
+            self.pagination_config.get("page_detection", {}).get(
+                "text_pattern", r"Page \d+ of (\d+)"
+            )
+        )
 
     def start_requests(self):
         """Generate initial requests."""
         start_page = self.restart_from_page
+
+        if self.pattern_config.get("json_api"):
+            # The site exposes its job list as JSON, no browser rendering needed
+            request = self._api_request(start_page)
+            request.meta["detect_total_pages"] = True
+            yield request
+            return
+
         if start_page > 1:
             # If restarting from a specific page, build the URL for that page
             start_url = self._build_page_url(start_page)
         else:
             start_url = self.home_url
 
-        yield Request(
-            url=start_url,
+        request = self._page_request(start_url, start_page)
+        # Only the first page tries to detect the total page count
+        request.meta["detect_total_pages"] = True
+        yield request
+
+    def _page_request(self, url: str, page_number: int) -> Request:
+        """Build the Playwright request for one result page."""
+        return Request(
+            url=url,
             callback=self.parse,
             meta={
                 "playwright": True,
                 "playwright_include_page": True,
-                "page_number": start_page,
+                "playwright_context": PLAYWRIGHT_CONTEXT,
+                "page_number": page_number,
                 "playwright_page_goto_kwargs": {"timeout": 60000},
             },
+            dont_filter=True,  # Allow duplicate URLs for different pages
         )
 
     async def parse(self, response: Response):
@@ -88,11 +416,12 @@ class JobUrlSpider(scrapy.Spider):
         current_page = response.meta.get("page_number", 1)
 
         try:
-            page = response.meta["playwright_page"]
+            # No Playwright page when the response was served from the HTTP cache
+            page = response.meta.get("playwright_page")
             self.logger.info(f"Processing page {current_page}")
 
             # Wait for dynamic content if specified
-            if "wait_for" in self.pattern_config:
+            if page and "wait_for" in self.pattern_config:
                 wait_config = self.pattern_config["wait_for"]
                 try:
                     if wait_config.get("type") == "selector":
@@ -102,9 +431,48 @@ class JobUrlSpider(scrapy.Spider):
                 except Exception as e:
                     self.logger.warning(f"Page {current_page}: Wait condition failed: {e}")
 
+            # Extract job posting URLs from current page
+            page_jobs = []
+            try:
+                page_jobs = self._extract_jobs_from_page(response)
+            except Exception as e:
+                self.logger.error(f"Page {current_page}: Job extraction failed: {e}")
+
+            # On the first page, try to detect the total page count so all remaining
+            # pages can be queued at once and fetched concurrently
+            follow_next_page = response.meta.get("follow_next_page", False)
+            if self.pagination_config.get("enabled", False) and response.meta.get(
+                "detect_total_pages"
+            ):
+                total_pages, authoritative = None, False
+                try:
+                    total_pages, authoritative = await self._detect_total_pages(page, response)
+                except Exception as e:
+                    self.logger.warning(f"Page {current_page}: Page count detection failed: {e}")
+
+                if total_pages and total_pages > current_page:
+                    self.total_pages = total_pages
+                    self.logger.info(
+                        f"Page {current_page}: Detected {total_pages} pages, "
+                        f"queuing pages {current_page + 1}-{total_pages}"
+                    )
+                    for next_page in range(current_page + 1, total_pages + 1):
+                        request = self._page_request(self._build_page_url(next_page), next_page)
+                        if next_page == total_pages and not authoritative:
+                            # Only a lower bound (e.g. a windowed paginator), so keep
+                            # following the next button from the last queued page
+                            request.meta["follow_next_page"] = True
+                        yield request
+                else:
+                    # Page count unknown, walk the pages one by one via the next button
+                    follow_next_page = True
+
             # Check if there's a next page by examining the next button status
             has_next_page = False
-            if self.pagination_config.get("enabled", False):
+            if follow_next_page and page is None:
+                # Cached page, no next button to inspect: continue while pages have jobs
+                has_next_page = bool(page_jobs)
+            elif follow_next_page:
                 try:
                     has_next_page = await self._check_next_page_available(page)
                     self.logger.info(f"Page {current_page}: Next page available: {has_next_page}")
@@ -118,69 +486,22 @@ class JobUrlSpider(scrapy.Spider):
                 next_page = current_page + 1
 
                 # Add delay between pages to be respectful
-                await page.wait_for_timeout(2000)  # 2 second delay between pages
+                if page:
+                    await page.wait_for_timeout(2000)  # 2 second delay between pages
 
                 next_page_url = self._build_page_url(next_page)
                 self.logger.info(f"Queuing next page: {next_page}")
 
-                yield Request(
-                    url=next_page_url,
-                    callback=self.parse,
-                    meta={
-                        "playwright": True,
-                        "playwright_include_page": True,
-                        "page_number": next_page,
-                        "playwright_page_goto_kwargs": {"timeout": 60000},
-                    },
-                    dont_filter=True,  # Allow duplicate URLs for different pages
-                )
-            else:
+                request = self._page_request(next_page_url, next_page)
+                request.meta["follow_next_page"] = True
+                yield request
+            elif follow_next_page:
                 self.logger.info(
                     f"Page {current_page}: No more pages available. Crawling complete."
                 )
 
-            # Extract job posting URLs from current page
-            page_jobs = []
-            try:
-                page_jobs = self._extract_jobs_from_page(response)
-            except Exception as e:
-                self.logger.error(f"Page {current_page}: Job extraction failed: {e}")
-
-            # Add unique jobs to our collection
-            new_jobs_count = 0
-            for job_data in page_jobs:
-                if job_data["url"] not in self.unique_urls:
-                    self.unique_urls.add(job_data["url"])
-                    self.job_urls.append(job_data)
-                    new_jobs_count += 1
-
-            # Track empty pages for early termination
-            if len(page_jobs) == 0:
-                self.empty_pages_count += 1
-                self.logger.warning(
-                    f"Page {current_page}: Empty page detected ({self.empty_pages_count}/{self.max_empty_pages})"
-                )
-                if self.empty_pages_count >= self.max_empty_pages:
-                    self.logger.error(
-                        f"Too many consecutive empty pages ({self.empty_pages_count}). Stopping crawl."
-                    )
-                    # Note: In Scrapy, we can't easily stop the entire crawl from here,
-                    # but this will help with debugging
-            else:
-                self.empty_pages_count = 0  # Reset counter on successful page
-
-            self.pages_crawled += 1
-            self.logger.info(
-                f"Page {current_page}: Found {len(page_jobs)} total jobs, {new_jobs_count} new unique jobs. Total unique: {len(self.job_urls)}"
-            )
-
-            # Update global results
-            global extraction_results
-            extraction_results["jobs"] = self.job_urls
-            extraction_results["total_jobs"] = len(self.job_urls)
-            extraction_results["total_pages_crawled"] = self.pages_crawled
-            extraction_results["total_pages_attempted"] = self.total_pages or "unknown"
-            extraction_results["extraction_timestamp"] = datetime.now().isoformat()
+            for job_data in self._record_page_jobs(current_page, page_jobs):
+                yield JobItem(**job_data)
 
         except Exception as e:
             self.logger.error(f"Page {current_page}: Critical error during parsing: {e}")
@@ -193,8 +514,132 @@ class JobUrlSpider(scrapy.Spider):
             except Exception as e:
                 self.logger.warning(f"Page {current_page}: Error closing page: {e}")
 
-    async def _detect_total_pages(self, page, response: Response) -> Optional[int]:
-        """Detect total number of pages from pagination elements."""
+    def parse_json(self, response: Response):
+        """Parse one page of a career site's JSON job API (see ``json_api`` config)."""
+        current_page = response.meta.get("page_number", 1)
+        api_config = self.pattern_config["json_api"]
+
+        try:
+            self.logger.info(f"Processing API page {current_page}")
+            data = orjson.loads(response.body)
+
+            # Queue the remaining pages concurrently when the API reports a page count,
+            # otherwise keep requesting pages until one comes back empty
+            raw_jobs = _lookup(data, api_config.get("jobs_path", "")) or []
+            follow_next_page = response.meta.get("follow_next_page", False)
+            if response.meta.get("detect_total_pages"):
+                total_pages = _lookup(data, api_config.get("total_pages_path", ""))
+                if isinstance(total_pages, int) and api_config.get("total_pages_path"):
+                    self.total_pages = total_pages
+                    for next_page in range(current_page + 1, total_pages + 1):
+                        yield self._api_request(next_page)
+                else:
+                    follow_next_page = True
+
+            if follow_next_page and raw_jobs:
+                request = self._api_request(current_page + 1)
+                request.meta["follow_next_page"] = True
+                yield request
+
+            page_jobs = []
+            try:
+                page_jobs = self._extract_jobs_from_api(raw_jobs, response)
+            except Exception as e:
+                self.logger.error(f"API page {current_page}: Job extraction failed: {e}")
+
+            for job_data in self._record_page_jobs(current_page, page_jobs):
+                yield JobItem(**job_data)
+
+        except Exception as e:
+            self.logger.error(f"API page {current_page}: Critical error during parsing: {e}")
+
+    def _api_request(self, page_number: int) -> Request:
+        """Build the plain HTTP request for one page of the JSON job API."""
+        return Request(
+            url=self.pattern_config["json_api"]["url"].format(page=page_number),
+            callback=self.parse_json,
+            meta={"page_number": page_number},
+            dont_filter=True,
+        )
+
+    def _extract_jobs_from_api(
+        self, raw_jobs: List[Any], response: Response
+    ) -> List[Dict[str, Any]]:
+        """Map job objects from a JSON API response to job entries."""
+        api_config = self.pattern_config["json_api"]
+        job_url_template = api_config["job_url"]
+        field_paths = api_config.get("fields") or {}
+
+        page_jobs = []
+        for raw_job in raw_jobs:
+            if not isinstance(raw_job, dict):
+                continue
+
+            try:
+                url = urljoin(self.home_url, job_url_template.format(**raw_job))
+            except (KeyError, IndexError, ValueError):
+                continue
+
+            metadata = {}
+            for field, path in field_paths.items():
+                value = _lookup(raw_job, path)
+                if value is not None:
+                    metadata[field] = value.strip() if isinstance(value, str) else value
+
+            page_jobs.append(
+                {
+                    "url": url,
+                    "title": metadata.get("title", ""),
+                    "location": metadata.get("location", ""),
+                    "department": metadata.get("department", ""),
+                    "job_type": metadata.get("job_type", ""),
+                    "posted_date": metadata.get("posted_date", ""),
+                    "company": self.pattern_config.get("company_name", ""),
+                    "source_url": response.url,
+                    "metadata": metadata,
+                }
+            )
+
+        return page_jobs
+
+    def _record_page_jobs(
+        self, current_page: int, page_jobs: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Update crawl progress with the jobs of a page and return the new unique ones."""
+        new_jobs = []
+        for job_data in page_jobs:
+            if job_data["url"] not in self.unique_urls:
+                self.unique_urls.add(job_data["url"])
+                new_jobs.append(job_data)
+        self.jobs_count += len(new_jobs)
+
+        # Track empty pages for early termination
+        if len(page_jobs) == 0:
+            self.empty_pages_count += 1
+            self.logger.warning(
+                f"Page {current_page}: Empty page detected ({self.empty_pages_count}/{self.max_empty_pages})"
+            )
+            if self.empty_pages_count >= self.max_empty_pages:
+                self.logger.error(
+                    f"Too many consecutive empty pages ({self.empty_pages_count}). Stopping crawl."
+                )
+                # Note: In Scrapy, we can't easily stop the entire crawl from here,
+                # but this will help with debugging
+        else:
+            self.empty_pages_count = 0  # Reset counter on successful page
+
+        self.pages_crawled += 1
+        self.logger.info(
+            f"Page {current_page}: Found {len(page_jobs)} total jobs, {len(new_jobs)} new unique jobs. Total unique: {self.jobs_count}"
+        )
+        return new_jobs
+
+    async def _detect_total_pages(self, page, response: Response) -> Tuple[Optional[int], bool]:
+        """Detect total number of pages from pagination elements.
+
+        Returns the page count and whether it is authoritative. Counts derived from
+        visible pagination links are only a lower bound.
+        """
         detection_config = self.pagination_config.get("page_detection", {})
         method = detection_config.get("method", "selector")
 
@@ -205,51 +650,43 @@ class JobUrlSpider(scrapy.Spider):
                 elements = response.css(selector)
                 if elements:
                     # Try to extract page numbers from text
-                    text_pattern = detection_config.get("text_pattern", r"Page \d+ of (\d+)")
                     for element in elements:
                         text = element.get()
                         if text:
-                            match = re.search(text_pattern, text)
+                            match = self._page_text_re.search(text)
                             if match:
-                                return int(match.group(1))
-
-            # Alternative: look for individual page links
-            page_links = response.css("a[href*='page=']::attr(href)").getall()
-            if page_links:
-                max_page = 0
-                for link in page_links:
-                    match = re.search(r"page=(\d+)", link)
-                    if match:
-                        max_page = max(max_page, int(match.group(1)))
-                if max_page > 0:
-                    return max_page
-
-            # Try to detect "last" page link
-            last_page_links = response.css(
-                "a[href*='page=']:contains('Last'), a[href*='page=']:contains('»')::attr(href)"
-            ).getall()
-            if last_page_links:
-                for link in last_page_links:
-                    match = re.search(r"page=(\d+)", link)
-                    if match:
-                        return int(match.group(1))
+                                return int(match.group(1)), True
+
+            # Alternative: the highest page number among all pagination links. A single
+            # pass also covers "Last"/"»" links, which are pagination links themselves,
+            # but windowed paginators only link a few pages ahead
+            max_page = 0
+            for link in response.xpath("//a[contains(@href, 'page=')]/@href").getall():
+                match = PAGE_NUMBER_RE.search(link)
+                if match:
+                    max_page = max(max_page, int(match.group(1)))
+            if max_page > 0:
+                return max_page, False
 
         elif method == "manual":
             # Use manually specified max pages
-            return self.pagination_config.get("max_pages", 1)
+            return self.pagination_config.get("max_pages", 1), True
 
         # Fallback: try to detect by looking for "next" button and following pagination
         return await self._detect_pages_by_navigation(page, response)
 
-    async def _detect_pages_by_navigation(self, page, response: Response) -> Optional[int]:
+    async def _detect_pages_by_navigation(
+        self, page, response: Response
+    ) -> Tuple[Optional[int], bool]:
         """Detect total pages by checking if next button exists and following pagination."""
         detection_config = self.pagination_config.get("page_detection", {})
         next_selector = detection_config.get(
-            "next_button_selector", ".pagination .next, .pager .next"
+            "next_button_selector",
+            self.pagination_config.get("next_button_selector", ".pagination .next, .pager .next"),
         )
 
-        # For now, let's limit to a reasonable number to avoid infinite loops
-        # In a production system, you might want to actually navigate through pages
+        # Cap how many pages are queued up front on the strength of a scraped count;
+        # pages beyond the cap are still reached by following the next button
         max_reasonable_pages = 200  # Safety limit
 
         # Check if there's a next button (indicates more pages)
@@ -260,15 +697,20 @@ class JobUrlSpider(scrapy.Spider):
             page_text = response.text
 
             # Look for patterns like "1-20 of 3380 results" or similar
-            results_pattern = r"(\d+)-(\d+) of (\d+)"
-            match = re.search(results_pattern, page_text)
+            match = RESULTS_RANGE_RE.search(page_text)
             if match:
-                total_results = int(match.group(3))
-                results_per_page = int(match.group(2)) - int(match.group(1)) + 1
+                first, last, total_results = (int(g.replace(",", "")) for g in match.groups())
+                results_per_page = last - first + 1
                 total_pages = (total_results + results_per_page - 1) // results_per_page
-                return min(total_pages, max_reasonable_pages)
+                if total_pages > max_reasonable_pages:
+                    self.logger.warning(
+                        f"Detected {total_pages} pages ({total_results} results), queuing the "
+                        f"first {max_reasonable_pages} and following the next button after that"
+                    )
+                    return max_reasonable_pages, False
+                return total_pages, True
 
-        return 1  # Default to single page if we can't detect
+        return 1, False  # Default to single page if we can't detect
 
     async def _check_next_page_available(self, page) -> bool:
         """Check if next page is available by examining the next button status."""
@@ -320,16 +762,16 @@ class JobUrlSpider(scrapy.Spider):
         """
         page_param = self.pagination_config.get("page_param", "page")
 
-        # Parse the original URL
-        parsed_url = urlparse(self.home_url)
-        query_params = parse_qs(parsed_url.query)
+        # The home URL is parsed once in __init__
+        parsed_url = self._parsed_home_url
 
         # Special case: if requesting page 1 and home URL doesn't have page parameter,
         # return home URL as-is (first page might not need page parameter)
-        if page_number == 1 and page_param not in query_params:
+        if page_number == 1 and page_param not in self._home_query_params:
             return self.home_url
 
         # Add or update the page parameter
+        query_params = dict(self._home_query_params)
         query_params[page_param] = [str(page_number)]
 
         # Rebuild the query string
@@ -354,20 +796,28 @@ class JobUrlSpider(scrapy.Spider):
         page_jobs = []
         selectors = self.pattern_config.get("job_url_selectors", [])
 
+        lexbor_tree = None
+
         for selector_config in selectors:
             selector = selector_config["selector"]
             attribute = selector_config.get("attribute", "href")
 
-            # Get elements matching the selector
-            elements = response.css(selector)
-
-            for element in elements:
-                # Extract URL from specified attribute
-                if attribute == "text":
-                    url = element.get()
-                else:
-                    url = element.attrib.get(attribute)
+            if self._use_lexbor and attribute != "text" and not selector_config.get("metadata"):
+                # Only link URLs are needed, so the faster lexbor parser can be used
+                if lexbor_tree is None:
+                    lexbor_tree = LexborHTMLParser(response.body)
+                elements = _lexbor_attribute_values(lexbor_tree, selector, attribute)
+            else:
+                # Get elements matching the selector and extract URL from specified attribute
+                elements = [
+                    (
+                        element,
+                        element.get() if attribute == "text" else element.attrib.get(attribute),
+                    )
+                    for element in response.css(selector)
+                ]
 
+            for element, url in elements:
                 if url:
                     # Convert relative URLs to absolute
                     full_url = urljoin(self.home_url, url)
@@ -376,8 +826,12 @@ class JobUrlSpider(scrapy.Spider):
                     if not self._is_job_url(full_url):
                         continue
 
-                    # Extract metadata
-                    metadata = self._extract_metadata(element, selector_config)
+                    # Extract metadata (lexbor is only used when there is none to extract)
+                    metadata = (
+                        self._extract_metadata(element, selector_config)
+                        if element is not None
+                        else {}
+                    )
 
                     job_data = {
                         "url": full_url,
@@ -397,53 +851,18 @@ class JobUrlSpider(scrapy.Spider):
 
     def _is_job_url(self, url: str) -> bool:
         """Check if URL is a valid job posting URL."""
-        # Filter out common non-job URLs
-        exclude_patterns = [
-            ".pdf",
-            ".jpg",
-            ".jpeg",
-            ".png",
-            ".gif",
-            "locationPicker",
-            "/apply/",
-            "/profile/",
-            "/search",
-            "/filter",
-            "javascript:",
-            "mailto:",
-            "tel:",
-            "#",
-        ]
-
         url_lower = url.lower()
-        for pattern in exclude_patterns:
-            if pattern in url_lower:
-                return False
+
+        # Filter out common non-job URLs
+        if is_excluded_url(url_lower):
+            return False
 
         # For Apple specifically, check for job detail URLs
         if "jobs.apple.com" in url_lower and "/details/" in url_lower:
             return True
 
         # General job URL patterns
-        job_patterns = [
-            "/job/",
-            "/jobs/",
-            "/career/",
-            "/careers/",
-            "/position/",
-            "/positions/",
-            "/opening/",
-            "/openings/",
-            "/details/",
-            "/listing/",
-            "/apply",
-        ]
-
-        for pattern in job_patterns:
-            if pattern in url_lower:
-                return True
-
-        return False
+        return has_job_url_pattern(url_lower)
 
     def _extract_metadata(self, element, selector_config: Dict[str, Any]) -> Dict[str, Any]:
         """Extract metadata from job listing element."""
@@ -499,14 +918,22 @@ def load_pattern_config(pattern_file: Path) -> Dict[str, Any]:
     """Load and validate pattern configuration from YAML file."""
     try:
         with open(pattern_file, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YamlLoader)
 
-        # Validate required fields
+        # Validate required fields (a JSON job API replaces the CSS selectors)
         required_fields = ["job_url_selectors"]
         for field in required_fields:
-            if field not in config:
+            if field not in config and "json_api" not in config:
                 raise ValueError(f"Missing required field '{field}' in pattern configuration")
 
+        api_config = config.get("json_api")
+        if api_config is not None:
+            for field in ("url", "job_url"):
+                if not isinstance(api_config, dict) or field not in api_config:
+                    raise ValueError(
+                        f"Missing required field 'json_api.{field}' in pattern configuration"
+                    )
+
         return config
 
     except yaml.YAMLError as e:
@@ -550,6 +977,25 @@ def load_pattern_config(pattern_file: Path) -> Dict[str, Any]:
     default=None,
     help="Restart crawling from a specific page number (useful for resuming failed crawls)",
 )
+@click.option(
+    "--http-cache",
+    is_flag=True,
+    help="Cache fetched pages on disk for an hour so re-runs and restarts skip refetching",
+)
+@click.option(
+    "--requests-per-second",
+    type=click.FloatRange(min=0, min_open=True),
+    default=0.2,
+    show_default=True,
+    help="Average request rate per domain (0.2 = one request every 5 seconds)",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Maximum number of result pages fetched in parallel",
+)
 def main(
     home_url: str,
     output_file: str,
@@ -557,6 +1003,9 @@ def main(
     user_agent: str,
     verbose: bool,
     restart_from_page: Optional[int],
+    http_cache: bool,
+    requests_per_second: float,
+    concurrency: int,
 ) -> None:
     """
     Fetch job posting URLs from company career pages using Scrapy-Playwright.
@@ -572,10 +1021,23 @@ def main(
         existing_data = None
         if restart_from_page and restart_from_page > 1:
             output_path = Path(output_file)
-            if output_path.exists():
+            stream_path = output_path.with_suffix(".jsonl")
+            if not output_path.exists() and stream_path.exists():
+                # The previous crawl was interrupted before writing the final output
+                try:
+                    with open(stream_path, "rb") as f:
+                        existing_data = {"jobs": [orjson.loads(line) for line in f if line.strip()]}
+                    click.echo(
+                        f"Loaded {len(existing_data['jobs'])} jobs from interrupted crawl in {stream_path}"
+                    )
+                    click.echo(f"Restarting from page {restart_from_page}")
+                except Exception as e:
+                    click.echo(f"Warning: Could not load existing data: {e}", err=True)
+                    existing_data = None
+            elif output_path.exists():
                 try:
-                    with open(output_path, "r", encoding="utf-8") as f:
-                        existing_data = json.load(f)
+                    with open(output_path, "rb") as f:
+                        existing_data = orjson.loads(f.read())
                     click.echo(
                         f"Loaded existing data: {existing_data.get('total_jobs', 0)} jobs from {existing_data.get('total_pages_crawled', 0)} pages"
                     )
@@ -588,48 +1050,69 @@ def main(
         settings = {
             "USER_AGENT": user_agent,
             "ROBOTSTXT_OBEY": True,
-            "DOWNLOAD_HANDLERS": {
-                "https": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
-                "http": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
-            },
             "TWISTED_REACTOR": "twisted.internet.asyncioreactor.AsyncioSelectorReactor",
-            "PLAYWRIGHT_BROWSER_TYPE": "chromium",
-            "PLAYWRIGHT_LAUNCH_OPTIONS": {
-                "headless": True,
-            },
-            "PLAYWRIGHT_DEFAULT_NAVIGATION_TIMEOUT": 60000,  # 60 seconds
-            "PLAYWRIGHT_DEFAULT_TIMEOUT": 60000,  # 60 seconds
+            **({"ASYNCIO_EVENT_LOOP": "uvloop.Loop"} if HAS_UVLOOP else {}),
             "DOWNLOAD_TIMEOUT": 60,  # 60 seconds
             "LOG_LEVEL": "DEBUG" if verbose else "INFO",
-            "CONCURRENT_REQUESTS": 1,  # Be respectful to the server
-            "DOWNLOAD_DELAY": 5,  # Increase delay to avoid rate limiting
-            "RANDOMIZE_DOWNLOAD_DELAY": 0.5,  # Add randomness to delays
+            # Pages are only fetched in parallel once the total page count is known;
+            # RateLimitMiddleware still spaces out the start of each request
+            "CONCURRENT_REQUESTS": concurrency,
+            "CONCURRENT_REQUESTS_PER_DOMAIN": concurrency,
+            # Politeness is handled per domain by RateLimitMiddleware instead
+            "DOWNLOAD_DELAY": 0,
+            # Ordered after HttpCacheMiddleware (900) so cache hits are never throttled
+            "DOWNLOADER_MIDDLEWARES": {RateLimitMiddleware: 950},
+            "RATE_LIMIT_PER_SECOND": requests_per_second,
             "RETRY_TIMES": 3,  # Retry failed requests
             "RETRY_HTTP_CODES": [500, 502, 503, 504, 408, 429],  # Add timeout and rate limit codes
             "SCHEDULER_PRIORITY_QUEUE": "scrapy.pqueues.ScrapyPriorityQueue",  # Ensure FIFO order
             "DEPTH_PRIORITY": 1,  # Process requests in depth order (sequential)
+            "ITEM_PIPELINES": {JobsJsonPipeline: 300},
+            "JOBS_OUTPUT_FILE": output_file,
         }
 
-        # Global variable to store results
-        global extraction_results
-        if existing_data:
-            # Start with existing data when restarting
-            extraction_results = existing_data.copy()
-        else:
-            extraction_results = {
-                "source_url": home_url,
-                "total_jobs": 0,
-                "extraction_timestamp": "",
-                "company_name": pattern_config.get("company_name", ""),
-                "jobs": [],
-            }
+        if not pattern_config.get("json_api"):
+            # Only rendered pages need the browser; JSON API crawls use Scrapy's own
+            # download handlers, so Chromium is never launched for them
+            settings.update(
+                {
+                    "DOWNLOAD_HANDLERS": {
+                        "https": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
+                        "http": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
+                    },
+                    "PLAYWRIGHT_BROWSER_TYPE": "chromium",
+                    "PLAYWRIGHT_LAUNCH_OPTIONS": {
+                        "headless": True,
+                    },
+                    # One browser context, created at startup and shared by every page;
+                    # only the pages themselves are opened and closed per request
+                    "PLAYWRIGHT_CONTEXTS": {PLAYWRIGHT_CONTEXT: {}},
+                    "PLAYWRIGHT_MAX_CONTEXTS": 1,
+                    "PLAYWRIGHT_ABORT_REQUEST": should_abort_request,
+                    "PLAYWRIGHT_DEFAULT_NAVIGATION_TIMEOUT": 60000,  # 60 seconds
+                    "PLAYWRIGHT_DEFAULT_TIMEOUT": 60000,  # 60 seconds
+                }
+            )
+
+        if http_cache:
+            # Cached responses skip the download handler, so parse() gets no Playwright
+            # page for them and extracts from the stored rendered HTML instead
+            settings.update(
+                {
+                    "HTTPCACHE_ENABLED": True,
+                    "HTTPCACHE_EXPIRATION_SECS": 3600,
+                    "HTTPCACHE_STORAGE": "scrapy.extensions.httpcache.FilesystemCacheStorage",
+                    "HTTPCACHE_IGNORE_HTTP_CODES": [500, 502, 503, 504, 408, 429],
+                }
+            )
 
         # Create and run spider
         process = CrawlerProcess(settings=settings)
+        crawler = process.create_crawler(JobUrlSpider)
 
         # Pass spider class and arguments instead of instance
         process.crawl(
-            JobUrlSpider,
+            crawler,
             home_url=home_url,
             pattern_config=pattern_config,
             restart_from_page=restart_from_page,
@@ -637,14 +1120,11 @@ def main(
         )
         process.start()
 
-        # Save results to JSON file
+        # JobsJsonPipeline has written the output file when the spider closed
         output_path = Path(output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        results = extraction_results
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        results = crawler.spider.extraction_summary
+        if not results:
+            raise RuntimeError("Crawl ended before any results were written")
 
         click.echo(f"Successfully extracted {results['total_jobs']} job URLs")
         click.echo(f"Results saved to: {output_path}")
@@ -1,20 +1,51 @@
+import asyncio
 import os
 import json
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch
+from elasticsearch.serializer import OrjsonSerializer
 
-if __name__ == '__main__':
+
+async def run_batch(es, query_vectors, k):
+    """Issue one kNN search per query vector concurrently."""
+    return await asyncio.gather(*[
+        es.search(index="jobs-json-embedding",
+                  knn={"field": vector_field,
+                       "query_vector": query_vector,
+                       "k": k,
+                       "num_candidates": max(100, 10 * k)},
+                  source=["job_id", "title"])
+        for query_vector in query_vectors
+    ])
+
+
+async def main():
     # Get index mapping in elasticSearch
-    es = Elasticsearch("http://localhost:9200")
+    # orjson serializes the 2560-float query vectors and parses responses
+    es = AsyncElasticsearch("http://localhost:9200",
+                            serializer=OrjsonSerializer(),
+                            http_compress=True,
+                            connections_per_node=25,
+                            request_timeout=60,
+                            retry_on_timeout=True,
+                            max_retries=3)
 
-    # mapping = es.indices.get_mapping(index="jobs-json-embedding")
+    # mapping = await es.indices.get_mapping(index="jobs-json-embedding")
     # with open('mapping.json','w') as f:
     #     json.dump(mapping.body, f, indent=4)
 
-    result = es.search(index="jobs-json-embedding", 
-                       query={"knn": {"field": vector_field, "query_vector": qwen3_embedding, "k": k}})
-    hits = result['hits']['hits']
-    if hits:
-        print(f"{len(hits)} documents found!\n")
-        # print("Document found:", hits[0]['_source'])
-    else:
-        print("Document not found") 
\ No newline at end of file
+    try:
+        results = await run_batch(es, [qwen3_embedding], k)
+    finally:
+        await es.close()
+
+    for result in results:
+        hits = result['hits']['hits']
+        if hits:
+            print(f"{len(hits)} documents found!\n")
+            # print("Document found:", hits[0]['_source'])
+        else:
+            print("Document not found")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
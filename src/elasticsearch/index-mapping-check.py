@@ -1,9 +1,18 @@
 import os
 import json
 import collections
+from itertools import chain
+from types import NoneType
 
-def validate_json_file(file_path, schema):
-    """Loads a JSON file and validates its columns against a schema."""
+# Exact Python type -> Elasticsearch type for scalar values
+_PY_TO_ES = {str: "text", bool: "boolean", int: "long", float: "float", dict: "object"}
+
+def flatten_schema_types(properties):
+    """Flattens mapping properties to {field: expected ES type}; untyped fields are objects."""
+    return {key: spec.get('type', 'object') for key, spec in properties.items()}
+
+def validate_json_file(file_path, schema_types):
+    """Loads a JSON file and validates its columns against a {field: expected type} schema."""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             document = json.load(f)
@@ -12,15 +21,15 @@ def validate_json_file(file_path, schema):
         return False
 
     # Validate that all required keys from the schema exist in the document
-    for key in schema.keys():
-        if key not in document:
-            print(f"ERROR in file '{file_path}': Missing required key '{key}'")
-            return False
+    missing = schema_types.keys() - document.keys()
+    if missing:
+        print(f"ERROR in file '{file_path}': Missing required keys {sorted(missing)}")
+        return False
     unmatched_key=[]
     # Validate the data type of each key
     for key, value in document.items():
-        if key in schema:
-            expected_type = schema[key]['type']
+        expected_type = schema_types.get(key)
+        if expected_type is not None:
             doc_type=determine_es_mapping_type(value)
             if doc_type != expected_type:
                 unmatched_key.append([key, doc_type, expected_type])
@@ -46,6 +55,11 @@ def determine_es_mapping_type(column_values):
                      "float", "boolean", "object"), or None if no definitive type
                      can be determined (e.g., empty list or all None values).
     """
+    es_type = _PY_TO_ES.get(type(column_values))
+    if es_type is not None:
+        return es_type
+
+    # Subclasses of the scalar types miss the exact-type lookup above
     if not isinstance(column_values, list):
         if isinstance(column_values, str):
             return "text"
@@ -61,24 +75,19 @@ def determine_es_mapping_type(column_values):
     if not column_values:
         return None
 
-    # Filter out None values. We determine type based on actual data.
-    non_none_values = [v for v in column_values if v is not None]
-
-    if not non_none_values:
-        return None # Column contains only None values or is empty after filtering
+    # Track all unique observed Python types (including types inside lists).
+    # map(type, ...) keeps the per-element work in C; None values are dropped afterwards.
+    observed_python_types = set(map(type, column_values))
 
-    # Track all unique observed Python types (including types inside lists)
-    observed_python_types = set()
+    if list in observed_python_types:
+        # If a value is a list, inspect its elements' types instead
+        observed_python_types.discard(list)
+        observed_python_types.update(
+            map(type, chain.from_iterable(v for v in column_values if isinstance(v, list)))
+        )
 
-    for value in non_none_values:
-        if isinstance(value, list):
-            # If the value is a list, inspect its elements' types
-            for item in value:
-                if item is not None:
-                    observed_python_types.add(type(item))
-        else:
-            # If the value is not a list, just add its type
-            observed_python_types.add(type(value))
+    # We determine type based on actual data, not None values
+    observed_python_types.discard(NoneType)
 
     # If no types were found after filtering (e.g., list of Nones like [None, None])
     if not observed_python_types:
@@ -132,7 +141,7 @@ if __name__ == "__main__":
 
     with open('mapping.json','r') as f:
         schema = json.load(f)
-    expected_schema = schema["jobs-json-embedding"]["mappings"]["properties"]
+    expected_schema = flatten_schema_types(schema["jobs-json-embedding"]["mappings"]["properties"])
 
     file_directory = "/home/hjx/elasticSearch/data/embedding_json/apple"
     for file in failed_str:
@@ -1,46 +1,99 @@
-import json
+import logging
+import logging.handlers
 import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import orjson
 from elasticsearch import Elasticsearch, helpers
+from elasticsearch.serializer import OrjsonSerializer
+
+logger = logging.getLogger(__name__)
+
+def _parse(filepath):
+    try:
+        return filepath, orjson.loads(Path(filepath).read_bytes())
+    except orjson.JSONDecodeError:
+        return filepath, None
+
+def _iter_json_paths(dir_path):
+    """Yield .json file paths under dir_path, pruning hidden dirs like .ipynb_checkpoints."""
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_json_paths(entry.path)
+            elif entry.name.endswith(".json"):
+                yield entry.path
+
+def iter_actions(dir_path):
+    """Yield one bulk index action per parseable JSON file under dir_path.
+
+    Files are parsed in a process pool so decoding overlaps with bulk indexing.
+    """
+    with ProcessPoolExecutor() as executor:
+        for filepath, data in executor.map(_parse, _iter_json_paths(dir_path), chunksize=32):
+            if data is None:
+                logger.warning("⚠️ Skipping invalid JSON: %s", filepath)
+                continue
+            yield {"_index": INDEX_NAME, "_source": data}
 
 def index_json_files(dir_path):
-    for root, _, files in os.walk(dir_path):
-        for filename in files:
-            if filename.endswith(".json"):
-                filepath = os.path.join(root, filename)
-                with open(filepath, "r", encoding="utf-8") as f:
-                    try:
-                        data = json.load(f)
-                    except json.JSONDecodeError:
-                        print(f"⚠️ Skipping invalid JSON: {filepath}")
-                        continue
-                try:
-                    response = es.index(index=INDEX_NAME, document=data)
-                    # Optional: print success for each doc
-                    print(f"Indexed {filepath}: {response['_id']}")
-                except Exception as e:
-                    print(f"Failed to index {filepath}: {e}")
-    print("indexing complete.")
+    indexed = 0
+    for ok, info in helpers.parallel_bulk(es, iter_actions(dir_path),
+                                          thread_count=4,
+                                          chunk_size=500,
+                                          queue_size=4,
+                                          raise_on_error=False,
+                                          request_timeout=60):
+        if ok:
+            indexed += 1
+        else:
+            logger.warning("Failed to index document: %s", info)
+    logger.info("indexing complete. %d documents indexed.", indexed)
 
 if __name__ == '__main__':
-    es = Elasticsearch("http://localhost:9200", verify_certs=False)
+    # Buffer log records and write them out in batches rather than one write per failure
+    log_handler = logging.handlers.MemoryHandler(capacity=1024,
+                                                 flushLevel=logging.ERROR,
+                                                 target=logging.StreamHandler())
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[log_handler])
+
+    # Gzip request bodies and keep enough pooled connections for the bulk threads
+    es = Elasticsearch("http://localhost:9200", verify_certs=False,
+                       serializer=OrjsonSerializer(),
+                       http_compress=True,
+                       connections_per_node=25,
+                       request_timeout=60,
+                       retry_on_timeout=True,
+                       max_retries=3)
     # Name of the index
     INDEX_NAME = "jobs-json-embedding"
 
     # Create index if it doesn't exist
     if not es.indices.exists(index=INDEX_NAME):
-        print(f"Index {INDEX_NAME} does not exist. Creating it.")
+        logger.info("Index %s does not exist. Creating it.", INDEX_NAME)
         mappings={
-            "mappings": {
             "properties": {
                 "qwen3_embedding": {
                     "type": "dense_vector",
-                    "dims": 2560  # replace with your embedding dimension
+                    "dims": 2560,  # replace with your embedding dimension
+                    "index": True,
+                    "similarity": "cosine",
+                    # int8 scalar quantization of the HNSW graph: ~4x less vector memory
+                    "index_options": {
+                        "type": "int8_hnsw",
+                        "m": 16,
+                        "ef_construction": 100
+                    }
                 },
                 "other_field": {
                     "type": "text"
                 }
-            }}}
+            }}
         es.indices.create(index=INDEX_NAME,
+                          mappings=mappings,
                           settings={
                               "index": {
                                   "number_of_shards":2,
@@ -48,9 +101,20 @@ if __name__ == '__main__':
                               }
                           })
 
-    path_to_json_dir = "/home/hjx/workspace/elasticSearch/data/embedding_json"
-    for company in os.listdir(path_to_json_dir):
-        dirs = os.listdir(os.path.join(path_to_json_dir,company))
-        latest = str(max(map(int, [d for d in dirs if d.isdigit()])))
-        index_json_files(os.path.join(path_to_json_dir, company+'/'+latest))
-        print(f"{company} indexing completed.")
\ No newline at end of file
+    # Disable refresh and replicas for the bulk load, restore them afterwards
+    es.indices.put_settings(index=INDEX_NAME,
+                            settings={"index": {"refresh_interval": "-1",
+                                                "number_of_replicas": 0}})
+    try:
+        path_to_json_dir = "/home/hjx/workspace/elasticSearch/data/embedding_json"
+        for company in os.listdir(path_to_json_dir):
+            dirs = os.listdir(os.path.join(path_to_json_dir,company))
+            latest = str(max(map(int, [d for d in dirs if d.isdigit()])))
+            index_json_files(os.path.join(path_to_json_dir, company+'/'+latest))
+            logger.info("%s indexing completed.", company)
+            log_handler.flush()
+    finally:
+        es.indices.put_settings(index=INDEX_NAME,
+                                settings={"index": {"refresh_interval": None,
+                                                    "number_of_replicas": 1}})
+        es.indices.refresh(index=INDEX_NAME)
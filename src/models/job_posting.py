@@ -5,12 +5,15 @@ This module provides a comprehensive dataclass for modeling job postings
 with JSON serialization/deserialization capabilities.
 """
 
-import json
-from dataclasses import dataclass, field, asdict
+import copy
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from enum import Enum
 
+import ijson
+import orjson
+
 
 class JobType(Enum):
     """Enumeration for job types."""
@@ -45,7 +48,48 @@ class WorkArrangement(Enum):
     HYBRID = "hybrid"
 
 
-@dataclass
+def _iter_jobs_data(f) -> Iterator[Dict[str, Any]]:
+    """
+    Incrementally parse job dicts from a binary JSON file object.
+
+    Raises:
+        ValueError: If the document is neither a list of jobs nor an object with a 'jobs' key
+    """
+    # Read past any amount of leading whitespace to reach the document's first byte
+    head = b""
+    while not head:
+        chunk = f.read(64)
+        if not chunk:
+            break
+        head = chunk.lstrip()
+    f.seek(0)
+
+    if head.startswith(b"["):
+        yield from ijson.items(f, "item", use_float=True)
+        return
+    if head.startswith(b"{"):
+        found = False
+        for job_data in ijson.items(f, "jobs.item", use_float=True):
+            found = True
+            yield job_data
+        # No items may also mean an empty 'jobs' list; only then re-check the whole document
+        if found:
+            return
+        f.seek(0)
+        if "jobs" in orjson.loads(f.read()):
+            return
+    raise ValueError("JSON file must contain either a list of jobs or an object with a 'jobs' key")
+
+
+def _dumps_option(indent: Optional[int]) -> int:
+    """orjson options for a posting; non-str metadata keys become strings as with json.dumps."""
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return option
+
+
+@dataclass(slots=True)
 class JobPosting:
     """
     Comprehensive data model for job postings.
@@ -131,12 +175,19 @@ class JobPosting:
         """
         Convert the JobPosting to a dictionary.
 
-        Handles enum serialization properly.
+        Handles enum serialization properly. List fields are shallow-copied and
+        metadata is deep-copied, matching what dataclasses.asdict returned.
 
         Returns:
             Dictionary representation of the job posting
         """
-        data = asdict(self)
+        data = {name: getattr(self, name) for name in _FIELD_NAMES}
+        for name in _LIST_FIELD_NAMES:
+            value = data[name]
+            # Only copy real lists; a str or None assigned to a list field stays as is
+            if isinstance(value, list):
+                data[name] = list(value)
+        data["metadata"] = copy.deepcopy(self.metadata) if self.metadata else {}
 
         # Convert enums to their values
         if self.job_type:
@@ -153,12 +204,13 @@ class JobPosting:
         Convert the JobPosting to a JSON string.
 
         Args:
-            indent: Number of spaces for indentation (None for compact JSON)
+            indent: Any truthy value indents by two spaces (None for compact JSON)
 
         Returns:
             JSON string representation of the job posting
         """
-        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+        # orjson serializes dataclasses and enum values natively, matching to_dict() output
+        return orjson.dumps(self, option=_dumps_option(indent)).decode()
 
     def save_to_file(self, file_path: str, indent: Optional[int] = 2) -> None:
         """
@@ -166,10 +218,10 @@ class JobPosting:
 
         Args:
             file_path: Path to save the JSON file
-            indent: Number of spaces for indentation
+            indent: Any truthy value indents by two spaces (None for compact JSON)
         """
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=indent, ensure_ascii=False)
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(self, option=_dumps_option(indent)))
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "JobPosting":
@@ -183,27 +235,13 @@ class JobPosting:
             JobPosting instance
         """
         # Handle enum conversion
-        if "job_type" in data and isinstance(data["job_type"], str):
-            try:
-                data["job_type"] = JobType(data["job_type"])
-            except ValueError:
-                data["job_type"] = None
-
-        if "experience_level" in data and isinstance(data["experience_level"], str):
-            try:
-                data["experience_level"] = ExperienceLevel(data["experience_level"])
-            except ValueError:
-                data["experience_level"] = None
-
-        if "work_arrangement" in data and isinstance(data["work_arrangement"], str):
-            try:
-                data["work_arrangement"] = WorkArrangement(data["work_arrangement"])
-            except ValueError:
-                data["work_arrangement"] = None
+        for key, members_by_value in _ENUM_FIELDS:
+            value = data.get(key)
+            if isinstance(value, str):
+                data[key] = members_by_value.get(value)
 
         # Filter out any keys that aren't valid fields
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered_data = {k: v for k, v in data.items() if k in valid_fields}
+        filtered_data = {k: v for k, v in data.items() if k in _VALID_FIELDS}
 
         return cls(**filtered_data)
 
@@ -218,7 +256,7 @@ class JobPosting:
         Returns:
             JobPosting instance
         """
-        data = json.loads(json_str)
+        data = orjson.loads(json_str)
         return cls.from_dict(data)
 
     @classmethod
@@ -232,8 +270,8 @@ class JobPosting:
         Returns:
             JobPosting instance
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = orjson.loads(f.read())
         return cls.from_dict(data)
 
     @classmethod
@@ -251,20 +289,9 @@ class JobPosting:
         Returns:
             List of JobPosting instances
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Handle different JSON structures
-        if isinstance(data, list):
-            jobs_data = data
-        elif isinstance(data, dict) and "jobs" in data:
-            jobs_data = data["jobs"]
-        else:
-            raise ValueError(
-                "JSON file must contain either a list of jobs or an object with a 'jobs' key"
-            )
-
-        return [cls.from_dict(job_data) for job_data in jobs_data]
+        # Stream the jobs so only one raw job dict is materialized at a time
+        with open(file_path, "rb") as f:
+            return [cls.from_dict(job_data) for job_data in _iter_jobs_data(f)]
 
     def update_scraped_date(self) -> None:
         """Update the scraped_date to the current timestamp."""
@@ -300,3 +327,17 @@ class JobPosting:
         elif self.hourly_rate_max:
             return f"Up to {self.salary_currency} {self.hourly_rate_max}/hr"
         return None
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(JobPosting))
+_LIST_FIELD_NAMES = tuple(f.name for f in fields(JobPosting) if f.default_factory is list)
+_VALID_FIELDS = frozenset(_FIELD_NAMES)
+# (field name, {enum value: member}) pairs; unknown values coerce to None
+_ENUM_FIELDS = tuple(
+    (key, {member.value: member for member in enum_cls})
+    for key, enum_cls in (
+        ("job_type", JobType),
+        ("experience_level", ExperienceLevel),
+        ("work_arrangement", WorkArrangement),
+    )
+)
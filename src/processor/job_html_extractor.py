@@ -8,16 +8,27 @@ and converts them to JobPosting dataclass instances.
 
 import argparse
 import os
+from concurrent.futures import ProcessPoolExecutor
 import re
 import sys
 import yaml
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from enum import Enum
+from itertools import chain
+from typing import Dict, List, Optional, Any, Pattern, Tuple, Type, Union
 from urllib.parse import urljoin, urlparse, parse_qs
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
+from bs4.filter import ElementFilter
 import logging
+import soupsieve
+
+try:
+    # Optional linear-time regex engine for the case-insensitive keyword scans
+    import re2
+except ImportError:
+    re2 = None
 
 # Add the parent directory to Python path to import our models
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -31,6 +42,169 @@ except ImportError:
     from semantix.models import JobPosting
     from semantix.models.job_posting import JobType, ExperienceLevel, WorkArrangement
 
+if re2 is not None:
+    RE2_IGNORECASE_OPTIONS = re2.Options()
+    RE2_IGNORECASE_OPTIONS.case_sensitive = False
+    RE2_IGNORECASE_OPTIONS.log_errors = False
+
+# Pattern sections whose selectors extract_job_posting runs against the soup
+SELECTOR_SECTIONS = ("basic_info", "time_info", "location", "content", "team_info", "application")
+
+# Page-not-found markers; checked against the page text before any extraction
+ERROR_INDICATORS = [
+    "Page not found",
+    "Sorry, this role does not exist",
+    "is no longer available",
+    "page-not-found-wrapper",
+]
+
+# Lowercase substrings that mark a qualification as an education requirement
+EDUCATION_KEYWORDS = [
+    "degree",
+    "bachelor",
+    "master",
+    "phd",
+    "bs",
+    "ba",
+    "ms",
+    "ma",
+    "mba",
+    "education",
+    "university",
+    "college",
+    "graduate",
+    "undergraduate",
+    "computer science",
+    "engineering",
+    "equivalent education",
+]
+
+# Narrower education list used to keep degree lines out of experience requirements
+EDUCATION_SKIP_KEYWORDS = [
+    "degree",
+    "bachelor",
+    "master",
+    "phd",
+    "bs",
+    "ba",
+    "ms",
+    "ma",
+    "education",
+    "university",
+    "college",
+]
+
+# Lowercase substrings that mark a qualification as an experience requirement
+EXPERIENCE_KEYWORDS = [
+    "experience",
+    "years",
+    "background",
+    "familiar",
+    "knowledge of",
+    "understanding of",
+    "skilled",
+    "proficient",
+    "expertise",
+    "working with",
+    "development",
+    "programming",
+]
+
+# One alternation per list, searched against the lowercased qualification
+EDUCATION_KEYWORDS_RE = re.compile("|".join(map(re.escape, EDUCATION_KEYWORDS)))
+EDUCATION_SKIP_KEYWORDS_RE = re.compile("|".join(map(re.escape, EDUCATION_SKIP_KEYWORDS)))
+EXPERIENCE_KEYWORDS_RE = re.compile("|".join(map(re.escape, EXPERIENCE_KEYWORDS)))
+
+# Leading characters that mark a line as a bullet point, and what to strip from it
+BULLET_CHARS = ("•", "-", "*", "▪", "‣", "▸")
+BULLET_STRIP_CHARS = "•-*▪‣▸ "
+
+# Leading compound of a CSS selector: optional tag name plus #id/.class/[attr] parts
+SELECTOR_ANCHOR_RE = re.compile(r"\s*([a-zA-Z][\w-]*)?((?:#[\w-]+|\.[\w-]+|\[[^\]]*\])*)")
+
+
+class SelectorAnchorFilter(ElementFilter):
+    """
+    Parse-time filter that only builds top-level elements able to anchor a selector.
+
+    Each configured selector is reduced to one necessary condition on its leftmost
+    compound (id, tag name, class or attribute name). Elements matching none of them
+    are skipped during parsing, while the full subtree of every kept element is built,
+    so descendant and child selectors still resolve exactly as on the full document.
+    """
+
+    def __init__(self, names, ids, classes, attributes):
+        super().__init__()
+        self.names = frozenset(names)
+        self.ids = frozenset(ids)
+        self.classes = frozenset(classes)
+        self.attributes = frozenset(attributes)
+
+    @classmethod
+    def from_selectors(cls, selectors: List[str]) -> Optional["SelectorAnchorFilter"]:
+        """Build a filter for the selectors, or None if any selector cannot be anchored."""
+        anchors = {"name": set(), "id": set(), "class": set(), "attr": set()}
+        for selector_list in selectors:
+            for selector in re.split(r",(?![^\[]*\])", selector_list):
+                # Sibling combinators and pseudo-classes depend on elements outside the
+                # anchor's subtree, so those selectors need the full document
+                if re.search(r"[:+~]", re.sub(r"\[[^\]]*\]", "", selector)):
+                    return None
+                match = SELECTOR_ANCHOR_RE.match(selector)
+                name, parts = match.groups()
+                remainder = selector[match.end() :]
+                if not (name or parts) or (remainder and remainder[0] not in " \t\n>"):
+                    return None
+                id_match = re.search(r"#([\w-]+)", parts)
+                class_match = re.search(r"\.([\w-]+)", parts)
+                attr_match = re.search(r"\[\s*([\w:-]+)", parts)
+                if id_match:
+                    anchors["id"].add(id_match.group(1))
+                elif name:
+                    anchors["name"].add(name.lower())
+                elif class_match:
+                    anchors["class"].add(class_match.group(1))
+                else:
+                    anchors["attr"].add(attr_match.group(1).lower())
+        if not any(anchors.values()):
+            return None
+        return cls(anchors["name"], anchors["id"], anchors["class"], anchors["attr"])
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        if name in self.names:
+            return True
+        if not attrs:
+            return False
+        if attrs.get("id") in self.ids:
+            return True
+        if self.classes:
+            element_classes = attrs.get("class") or ""
+            if isinstance(element_classes, str):
+                element_classes = element_classes.split()
+            if not self.classes.isdisjoint(element_classes):
+                return True
+        return not self.attributes.isdisjoint(attrs)
+
+    def allow_string_creation(self, string: str) -> bool:
+        # Top-level strings outside every kept element are never selected
+        return False
+
+
+def compile_keyword_pattern(pattern: str) -> Pattern:
+    """
+    Compile a case-insensitive skill or keyword pattern.
+
+    re2 scans text in a single linear pass instead of retrying each start position, so
+    it is preferred when installed; patterns it cannot express (backreferences,
+    lookarounds) fall back to the stdlib re engine.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern, RE2_IGNORECASE_OPTIONS)
+        except re2.error:
+            pass
+    return re.compile(pattern, re.IGNORECASE)
+
 
 class HTMLJobExtractor:
     """Extracts job posting information from HTML files using YAML configuration patterns."""
@@ -44,7 +218,11 @@ class HTMLJobExtractor:
         """
         self.pattern_file = pattern_file
         self.patterns = self._load_patterns()
+        self.regexes = self._compile_regexes()
+        self._transformations = self.patterns.get("transformations", {})
         self.logger = logging.getLogger(__name__)
+        self._compiled_selectors: Dict[str, Any] = {}
+        self._strainer = SelectorAnchorFilter.from_selectors(self._configured_selectors())
 
     def _load_patterns(self) -> Dict[str, Any]:
         """Load extraction patterns from YAML file."""
@@ -63,6 +241,76 @@ class HTMLJobExtractor:
         except (FileNotFoundError, yaml.YAMLError) as e:
             raise ValueError(f"Error loading pattern file {self.pattern_file}: {e}")
 
+    def _compile_regexes(self) -> Dict[str, Any]:
+        """Compile every regex in the pattern config once, instead of on each HTML file."""
+        skills_config = self.patterns.get("skills_extraction", {})
+        salary_patterns = self.patterns.get("salary_patterns", {})
+        range_pattern = salary_patterns.get("salary_range_pattern")
+        hourly_pattern = salary_patterns.get("hourly_rate_pattern")
+
+        return {
+            "technical_skills": [
+                compile_keyword_pattern(pattern)
+                for pattern in skills_config.get("technical_skills_patterns", [])
+            ],
+            "soft_skills": [
+                compile_keyword_pattern(pattern)
+                for pattern in skills_config.get("soft_skills_patterns", [])
+            ],
+            "salary_range": re.compile(range_pattern) if range_pattern else None,
+            "hourly_rate": re.compile(hourly_pattern) if hourly_pattern else None,
+            "experience_levels": self._compile_keyword_categories(
+                "experience_patterns", ExperienceLevel
+            ),
+            "job_types": self._compile_keyword_categories("job_type_patterns", JobType),
+            "work_arrangements": self._compile_keyword_categories(
+                "work_arrangement_patterns", WorkArrangement
+            ),
+            "transformations": {
+                name: re.compile(config["pattern"])
+                for name, config in self.patterns.get("transformations", {}).items()
+                if config.get("type") == "regex_replace" and config.get("pattern")
+            },
+        }
+
+    def _compile_keyword_categories(
+        self, section: str, enum_cls: Type[Enum]
+    ) -> List[Tuple[Enum, List[Pattern]]]:
+        """
+        Compile each category's keywords into case-insensitive patterns.
+
+        Categories are kept in config order so the first matching one still wins;
+        categories that are not members of enum_cls are dropped.
+        """
+        categories = []
+        for category, keywords in self.patterns.get(section, {}).items():
+            try:
+                member = enum_cls(category)
+            except ValueError:
+                continue
+            categories.append((member, [compile_keyword_pattern(k) for k in keywords]))
+        return categories
+
+    def _configured_selectors(self) -> List[str]:
+        """Collect every CSS selector referenced by the extraction sections."""
+        selectors = []
+        for section in SELECTOR_SECTIONS:
+            for config in (self.patterns.get(section) or {}).values():
+                if isinstance(config, str):
+                    selectors.append(config)
+                elif isinstance(config, dict):
+                    if config.get("selector"):
+                        selectors.append(config["selector"])
+                    selectors.extend(config.get("fallback_selectors") or [])
+        return selectors
+
+    def _compile_selector(self, selector: str) -> Any:
+        """Compile a CSS selector once; soup.select_one() would re-resolve it on every call."""
+        compiled = self._compiled_selectors.get(selector)
+        if compiled is None:
+            compiled = self._compiled_selectors[selector] = soupsieve.compile(selector)
+        return compiled
+
     def _extract_with_selector(
         self, soup: BeautifulSoup, config: Dict[str, Any], source_url: str = ""
     ) -> Optional[str]:
@@ -101,7 +349,7 @@ class HTMLJobExtractor:
 
             # Try primary selector
             if selector:
-                element = soup.select_one(selector)
+                element = self._compile_selector(selector).select_one(soup)
                 if element:
                     value = self._get_element_value(element, attribute)
                     if value:
@@ -109,7 +357,7 @@ class HTMLJobExtractor:
 
             # Try fallback selectors
             for fallback in fallback_selectors:
-                element = soup.select_one(fallback)
+                element = self._compile_selector(fallback).select_one(soup)
                 if element:
                     value = self._get_element_value(element, attribute)
                     if value:
@@ -118,7 +366,7 @@ class HTMLJobExtractor:
             return None
         else:
             # Simple string selector
-            element = soup.select_one(config)
+            element = self._compile_selector(config).select_one(soup)
             if element:
                 return element.get_text(strip=True)
             return None
@@ -127,58 +375,30 @@ class HTMLJobExtractor:
         """Get value from HTML element based on attribute type."""
         if attribute == "text":
             return element.get_text(strip=True)
-        elif attribute == "content":
-            return element.get("content")
-        elif attribute == "href":
-            return element.get("href")
-        elif attribute in ["datetime", "value", "id", "class"]:
-            return element.get(attribute)
-        else:
-            return element.get(attribute)
+        # content, href, datetime, value, id, class and any other attribute
+        return element.get(attribute)
 
     def _apply_transform(self, value: str, transform: Optional[str], source_url: str = "") -> str:
         """Apply transformation to extracted value."""
         if not transform or not value:
             return value
 
-        transformations = self.patterns.get("transformations", {})
-        if transform in transformations:
-            transform_config = transformations[transform]
+        if transform in self._transformations:
+            transform_config = self._transformations[transform]
             transform_type = transform_config.get("type")
 
             if transform_type == "regex_replace":
-                pattern = transform_config.get("pattern")
+                pattern = self.regexes["transformations"].get(transform)
+                if pattern is None:
+                    return value
                 replacement = transform_config.get("replacement", "")
-                return re.sub(pattern, replacement, value)
+                return pattern.sub(replacement, value)
 
             elif transform_type == "whitespace_normalize":
                 return " ".join(value.split())
 
             elif transform_type == "bullet_points_to_list":
-                # Extract bullet points from text - enhanced for HTML content
-                if not value:
-                    return []
-
-                # Try to split by common bullet point patterns
-                lines = value.split("\n")
-                bullet_points = []
-
-                for line in lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    # Remove common bullet point characters and clean
-                    if line.startswith(("•", "-", "*", "▪", "‣", "▸")):
-                        clean_line = line.lstrip("•-*▪‣▸ ").strip()
-                        if clean_line:
-                            bullet_points.append(clean_line)
-                    elif (
-                        line and len(line.strip()) > 10
-                    ):  # Assume non-bullet lines that are long enough are items
-                        bullet_points.append(line.strip())
-
-                return bullet_points if bullet_points else [value.strip()] if value.strip() else []
+                return self._split_bullet_points(value)
 
             elif transform_type == "extract_html_list_items":
                 # Extract list items from HTML - this needs the soup object
@@ -193,6 +413,30 @@ class HTMLJobExtractor:
 
         return value
 
+    def _split_bullet_points(self, value: str) -> List[str]:
+        """Split text into bullet points, stripping common bullet characters."""
+        if not value:
+            return []
+
+        # Try to split by common bullet point patterns
+        lines = value.split("\n")
+        bullet_points = []
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            # Remove common bullet point characters and clean
+            if line.startswith(BULLET_CHARS):
+                clean_line = line.lstrip(BULLET_STRIP_CHARS).strip()
+                if clean_line:
+                    bullet_points.append(clean_line)
+            elif len(line) > 10:  # Assume non-bullet lines that are long enough are items
+                bullet_points.append(line)
+
+        return bullet_points if bullet_points else [value.strip()] if value.strip() else []
+
     def _extract_list_items(self, soup: BeautifulSoup, selector: str) -> List[str]:
         """
         Extract list items from HTML elements as a list of strings.
@@ -204,12 +448,12 @@ class HTMLJobExtractor:
         Returns:
             List of text content from list items
         """
-        container = soup.select_one(selector)
+        container = self._compile_selector(selector).select_one(soup)
         if not container:
             return []
 
         # Look for list items within the container
-        list_items = container.select("li")
+        list_items = self._compile_selector("li").select(container)
         if list_items:
             # Extract text from each list item and clean it
             items = []
@@ -222,37 +466,34 @@ class HTMLJobExtractor:
         # If no list items found, try to extract bullet points from text
         text_content = container.get_text()
         if text_content:
-            return self._apply_transform(text_content, "bullet_points_to_list")
+            return self._split_bullet_points(text_content)
 
         return []
 
     def _extract_skills(self, text_content: str) -> Dict[str, List[str]]:
         """Extract skills from text using pattern matching."""
-        skills_config = self.patterns.get("skills_extraction", {})
-        technical_patterns = skills_config.get("technical_skills_patterns", [])
-        soft_patterns = skills_config.get("soft_skills_patterns", [])
-
         required_skills = []
 
         # Extract technical skills
-        for pattern in technical_patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    required_skills.extend(match)
-                else:
-                    required_skills.append(match)
+        for pattern in self.regexes["technical_skills"]:
+            matches = pattern.findall(text_content)
+            # findall yields tuples only when the pattern has more than one group
+            if pattern.groups > 1:
+                required_skills.extend(chain.from_iterable(matches))
+            else:
+                required_skills.extend(matches)
 
         # For Apple jobs, soft skills should go to required_skills, not preferred_skills
         # Only extract soft skills if they appear in qualifications text
-        for pattern in soft_patterns:
-            if re.search(pattern, text_content, re.IGNORECASE):
+        for pattern in self.regexes["soft_skills"]:
+            if pattern.search(text_content):
                 # Clean up the pattern to get readable skill name
-                skill_name = pattern.replace("\\\\b", "").replace("\\b", "").strip()
+                skill_name = pattern.pattern.replace("\\\\b", "").replace("\\b", "").strip()
                 required_skills.append(skill_name)
 
         return {
-            "required_skills": list(set(required_skills)),
+            # Dedupe in first-seen order so repeated runs write identical JSON
+            "required_skills": list(dict.fromkeys(required_skills)),
             "preferred_skills": [],  # Empty for Apple jobs as they don't have separate preferred skills
         }
 
@@ -261,13 +502,12 @@ class HTMLJobExtractor:
         if not pay_text:
             return {}
 
-        salary_patterns = self.patterns.get("salary_patterns", {})
         result = {}
 
         # Extract salary range
-        range_pattern = salary_patterns.get("salary_range_pattern")
+        range_pattern = self.regexes["salary_range"]
         if range_pattern:
-            match = re.search(range_pattern, pay_text)
+            match = range_pattern.search(pay_text)
             if match:
                 try:
                     min_salary = float(match.group(1).replace(",", ""))
@@ -279,9 +519,9 @@ class HTMLJobExtractor:
                     pass
 
         # Extract hourly rate
-        hourly_pattern = salary_patterns.get("hourly_rate_pattern")
+        hourly_pattern = self.regexes["hourly_rate"]
         if hourly_pattern:
-            match = re.search(hourly_pattern, pay_text)
+            match = hourly_pattern.search(pay_text)
             if match:
                 try:
                     hourly_rate = float(match.group(1))
@@ -295,46 +535,32 @@ class HTMLJobExtractor:
         self, title: str, description: str
     ) -> Optional[ExperienceLevel]:
         """Determine experience level from title and description."""
-        exp_patterns = self.patterns.get("experience_patterns", {})
-        combined_text = f"{title} {description}".lower()
+        combined_text = f"{title} {description}"
 
-        for level, keywords in exp_patterns.items():
-            for keyword in keywords:
-                if re.search(keyword, combined_text, re.IGNORECASE):
-                    try:
-                        return ExperienceLevel(level)
-                    except ValueError:
-                        continue
+        for level, patterns in self.regexes["experience_levels"]:
+            for pattern in patterns:
+                if pattern.search(combined_text):
+                    return level
 
         return None
 
     def _determine_job_type(self, title: str, description: str) -> Optional[JobType]:
         """Determine job type from title and description."""
-        job_patterns = self.patterns.get("job_type_patterns", {})
-        combined_text = f"{title} {description}".lower()
+        combined_text = f"{title} {description}"
 
-        for job_type, keywords in job_patterns.items():
-            for keyword in keywords:
-                if re.search(keyword, combined_text, re.IGNORECASE):
-                    try:
-                        return JobType(job_type)
-                    except ValueError:
-                        continue
+        for job_type, patterns in self.regexes["job_types"]:
+            for pattern in patterns:
+                if pattern.search(combined_text):
+                    return job_type
 
         return JobType.FULL_TIME  # Default assumption
 
     def _determine_work_arrangement(self, description: str) -> Optional[WorkArrangement]:
         """Determine work arrangement from description."""
-        work_patterns = self.patterns.get("work_arrangement_patterns", {})
-        text = description.lower()
-
-        for arrangement, keywords in work_patterns.items():
-            for keyword in keywords:
-                if re.search(keyword, text, re.IGNORECASE):
-                    try:
-                        return WorkArrangement(arrangement)
-                    except ValueError:
-                        continue
+        for arrangement, patterns in self.regexes["work_arrangements"]:
+            for pattern in patterns:
+                if pattern.search(description):
+                    return arrangement
 
         return None
 
@@ -358,14 +584,41 @@ class HTMLJobExtractor:
 
         return result
 
+    def _parse_html(
+        self, html_content: Union[str, bytes], parse_only: Optional[ElementFilter] = None
+    ) -> BeautifulSoup:
+        """Parse HTML with the C-based lxml parser, falling back to html.parser without lxml."""
+        try:
+            return BeautifulSoup(html_content, "lxml", parse_only=parse_only)
+        except FeatureNotFound:
+            return BeautifulSoup(html_content, "html.parser", parse_only=parse_only)
+
+    def _find_error_indicator(self, html_content: Union[str, bytes]) -> Optional[str]:
+        """Return the error-page indicator found in the page text, if any."""
+        # The text is a subset of the markup, so a raw substring scan rules out almost
+        # every page without parsing; only candidate pages get a full parse to confirm
+        raw = html_content.lower()
+        if isinstance(raw, bytes):
+            candidates = [i for i in ERROR_INDICATORS if i.lower().encode() in raw]
+        else:
+            candidates = [i for i in ERROR_INDICATORS if i.lower() in raw]
+        if not candidates:
+            return None
+
+        html_text = self._parse_html(html_content).get_text().lower()
+        for indicator in candidates:
+            if indicator.lower() in html_text:
+                return indicator
+        return None
+
     def extract_job_posting(
-        self, html_content: str, source_url: str = "", filename: str = ""
+        self, html_content: Union[str, bytes], source_url: str = "", filename: str = ""
     ) -> Optional[JobPosting]:
         """
         Extract job posting information from HTML content.
 
         Args:
-            html_content: HTML content to parse
+            html_content: HTML content to parse, as text or raw bytes
             source_url: Source URL of the job posting
             filename: Filename of the HTML file (for debugging)
 
@@ -373,21 +626,14 @@ class HTMLJobExtractor:
             JobPosting instance or None if extraction fails
         """
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
-
             # Check for "page not found" or error pages
-            error_indicators = [
-                "Page not found",
-                "Sorry, this role does not exist",
-                "is no longer available",
-                "page-not-found-wrapper",
-            ]
-
-            html_text = soup.get_text().lower()
-            for indicator in error_indicators:
-                if indicator.lower() in html_text:
-                    self.logger.warning(f"Skipping error page in {filename}: {indicator}")
-                    return None
+            indicator = self._find_error_indicator(html_content)
+            if indicator:
+                self.logger.warning(f"Skipping error page in {filename}: {indicator}")
+                return None
+
+            # Only build the elements the configured selectors can match
+            soup = self._parse_html(html_content, parse_only=self._strainer)
 
             # Extract basic information
             basic_config = self.patterns.get("basic_info", {})
@@ -436,13 +682,10 @@ class HTMLJobExtractor:
                 soup, content_config.get("preferred_qualifications", {}).get("selector", "")
             )
 
-            # Also get text versions for skills extraction
-            required_quals_text = self._extract_with_selector(
-                soup, content_config.get("required_qualifications"), source_url
-            )
-            preferred_quals_text = self._extract_with_selector(
-                soup, content_config.get("preferred_qualifications"), source_url
-            )
+            # Text versions for skills extraction come from the same items, so each
+            # qualifications container is only selected once
+            required_quals_text = " ".join(minimum_qualifications)
+            preferred_quals_text = " ".join(preferred_qualifications)
 
             # Extract team information
             team_config = self.patterns.get("team_info", {})
@@ -465,13 +708,10 @@ class HTMLJobExtractor:
             salary_data = self._extract_salary_info(pay_benefit or "")
 
             # Determine job characteristics
-            experience_level = self._determine_experience_level(
-                title or "", f"{description or ''} {combined_quals}"
-            )
+            description_and_quals = f"{description or ''} {combined_quals}"
+            experience_level = self._determine_experience_level(title or "", description_and_quals)
             job_type = self._determine_job_type(title or "", description or "")
-            work_arrangement = self._determine_work_arrangement(
-                f"{description or ''} {combined_quals}"
-            )
+            work_arrangement = self._determine_work_arrangement(description_and_quals)
 
             # Extract additional fields from basic_info
             source_platform = self._extract_with_selector(
@@ -545,31 +785,9 @@ class HTMLJobExtractor:
         """Extract education-specific requirements from qualifications list."""
         education_requirements = []
 
-        # Education-related keywords to look for
-        education_keywords = [
-            "degree",
-            "bachelor",
-            "master",
-            "phd",
-            "bs",
-            "ba",
-            "ms",
-            "ma",
-            "mba",
-            "education",
-            "university",
-            "college",
-            "graduate",
-            "undergraduate",
-            "computer science",
-            "engineering",
-            "equivalent education",
-        ]
-
         for qual in qualifications:
-            qual_lower = qual.lower()
             # Check if any education keyword appears in the qualification
-            if any(keyword in qual_lower for keyword in education_keywords):
+            if EDUCATION_KEYWORDS_RE.search(qual.lower()):
                 education_requirements.append(qual)
 
         return education_requirements
@@ -580,45 +798,14 @@ class HTMLJobExtractor:
         """Extract experience-specific requirements from qualifications lists."""
         experience_requirements = []
 
-        # Experience-related keywords to look for
-        experience_keywords = [
-            "experience",
-            "years",
-            "background",
-            "familiar",
-            "knowledge of",
-            "understanding of",
-            "skilled",
-            "proficient",
-            "expertise",
-            "working with",
-            "development",
-            "programming",
-        ]
-
         # Check minimum qualifications for experience-related items
         for qual in minimum_quals:
             qual_lower = qual.lower()
             # Skip education requirements
-            if any(
-                edu_keyword in qual_lower
-                for edu_keyword in [
-                    "degree",
-                    "bachelor",
-                    "master",
-                    "phd",
-                    "bs",
-                    "ba",
-                    "ms",
-                    "ma",
-                    "education",
-                    "university",
-                    "college",
-                ]
-            ):
+            if EDUCATION_SKIP_KEYWORDS_RE.search(qual_lower):
                 continue
             # Include experience-related items
-            if any(keyword in qual_lower for keyword in experience_keywords):
+            if EXPERIENCE_KEYWORDS_RE.search(qual_lower):
                 experience_requirements.append(qual)
 
         # Add all preferred qualifications as they are typically experience-related
@@ -626,13 +813,44 @@ class HTMLJobExtractor:
 
         return experience_requirements
 
-    def process_html_files(self, html_dump_dir: str, json_dump_dir: str) -> None:
+    def _process_html_file(
+        self, html_file: Path, json_dir: Path
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Extract one HTML file and save the job posting next to the others as JSON.
+
+        Returns:
+            (title, job_id, error); title and job_id are None when extraction failed,
+            error is set when processing raised
+        """
+        try:
+            # Raw bytes let the parser decode from the page's declared charset
+            with open(html_file, "rb") as f:
+                html_content = f.read()
+
+            job_posting = self.extract_job_posting(html_content, filename=html_file.name)
+            if not job_posting:
+                return None, None, None
+
+            # Save JobPosting as JSON
+            json_filepath = json_dir / (html_file.stem + ".json")
+            job_posting.save_to_file(str(json_filepath), indent=2)
+            return job_posting.title, job_posting.job_id, None
+
+        except Exception as e:
+            return None, None, str(e)
+
+    def process_html_files(
+        self, html_dump_dir: str, json_dump_dir: str, max_workers: Optional[int] = None
+    ) -> None:
         """
         Process all HTML files in the dump directory and extract job postings.
 
         Args:
             html_dump_dir: Directory containing HTML files
             json_dump_dir: Directory to save extracted JSON files
+            max_workers: Worker processes for extraction (None for one per CPU, 1 to run
+                in this process)
         """
         html_dir = Path(html_dump_dir)
         json_dir = Path(json_dump_dir)
@@ -652,31 +870,38 @@ class HTMLJobExtractor:
 
         print(f"Processing {len(html_files)} HTML files...")
 
-        for html_file in html_files:
-            try:
-                print(f"Processing: {html_file.name}")
-
-                with open(html_file, "r", encoding="utf-8") as f:
-                    html_content = f.read()
-
-                job_posting = self.extract_job_posting(html_content, filename=html_file.name)
-
-                if job_posting:
-                    # Generate output filename
-                    json_filename = html_file.stem + ".json"
-                    json_filepath = json_dir / json_filename
+        # Pages are independent and extraction is CPU-bound, so fan them out over processes
+        executor = None
+        if max_workers == 1:
+            results = (self._process_html_file(html_file, json_dir) for html_file in html_files)
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker_extractor,
+                initargs=(self.pattern_file,),
+            )
+            results = executor.map(
+                _process_html_file_in_worker,
+                html_files,
+                [json_dir] * len(html_files),
+                chunksize=16,
+            )
 
-                    # Save JobPosting as JSON
-                    job_posting.save_to_file(str(json_filepath), indent=2)
-                    print(f"  ✓ Extracted: {job_posting.title} (ID: {job_posting.job_id})")
-                    successful_extractions += 1
-                else:
+        try:
+            for html_file, (title, job_id, error) in zip(html_files, results):
+                print(f"Processing: {html_file.name}")
+                if error is not None:
+                    print(f"  ✗ Error processing {html_file.name}: {error}")
+                    failed_extractions += 1
+                elif title is None:
                     print("  ✗ Failed to extract job posting")
                     failed_extractions += 1
-
-            except Exception as e:
-                print(f"  ✗ Error processing {html_file.name}: {e}")
-                failed_extractions += 1
+                else:
+                    print(f"  ✓ Extracted: {title} (ID: {job_id})")
+                    successful_extractions += 1
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         print("\nExtraction Summary:")
         print(f"  Successful: {successful_extractions}")
@@ -685,6 +910,21 @@ class HTMLJobExtractor:
         print(f"\nJSON files saved to: {json_dump_dir}")
 
 
+# Per-process extractor, built once by the pool initializer instead of once per file
+_worker_extractor: Optional[HTMLJobExtractor] = None
+
+
+def _init_worker_extractor(pattern_file: str) -> None:
+    global _worker_extractor
+    _worker_extractor = HTMLJobExtractor(pattern_file)
+
+
+def _process_html_file_in_worker(
+    html_file: Path, json_dir: Path
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    return _worker_extractor._process_html_file(html_file, json_dir)
+
+
 def main():
     """Main entry point for the job HTML extractor."""
     parser = argparse.ArgumentParser(
@@ -701,6 +941,12 @@ def main():
         default="apple_pattern.yaml",
         help="YAML pattern configuration file (default: apple_pattern.yaml)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for extraction (default: one per CPU, 1 disables the pool)",
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
 
     args = parser.parse_args()
@@ -723,7 +969,9 @@ def main():
     try:
         # Create extractor and process files
         extractor = HTMLJobExtractor(args.pattern_yaml)
-        extractor.process_html_files(args.html_dump_dir, args.json_dump_dir)
+        extractor.process_html_files(
+            args.html_dump_dir, args.json_dump_dir, max_workers=args.workers
+        )
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -1 +1,17 @@
 """Configuration for the pytest test suite."""
+
+import importlib.util
+import sys
+
+from tests import TESTS_DIR
+
+SRC_DIR = TESTS_DIR.parent / "src"
+
+# The sources live in src/ but import each other as ``semantix``; register src/
+# under that name so the tests run against the working tree without installing it
+if importlib.util.find_spec("semantix") is None:
+    _spec = importlib.util.spec_from_file_location(
+        "semantix", SRC_DIR / "__init__.py", submodule_search_locations=[str(SRC_DIR)]
+    )
+    sys.modules["semantix"] = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(sys.modules["semantix"])
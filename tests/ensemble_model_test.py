@@ -16,13 +16,12 @@ client = httpclient.InferenceServerClient(url="localhost:8000")
 file = "/home/hjx/workspace/semantix/tests/test_resume.pdf"
 doc = fitz.open(file)
 
-content = []
-for page in doc:
-    content += page.get_text()
+# Join whole pages; `+=` on a list would append the text one character at a time
+content = ''.join(page.get_text() for page in doc)
 print(content[0])
 k=10
 es_query={}
-text_to_embed=[''.join(content)]
+text_to_embed=[content]
 inputs = [
     httpclient.InferInput("Query", [1,1], "BYTES"),
     httpclient.InferInput("ElasticsearchQuery", [1], "BYTES"),
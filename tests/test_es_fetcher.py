@@ -0,0 +1,176 @@
+import importlib.util
+import sys
+import types
+
+import numpy as np
+import orjson
+import pytest
+
+from tests import TESTS_DIR
+
+MODEL_FILE = TESTS_DIR.parent / "triton" / "es_fetcher" / "1" / "model.py"
+FILTER_PATH = [
+    "responses.hits.hits._source",
+    "responses.hits.hits._score",
+    "responses.error",
+    "responses.status",
+]
+
+
+def _orjson_serializes_float16():
+    try:
+        orjson.dumps(np.zeros(1, dtype=np.float16), option=orjson.OPT_SERIALIZE_NUMPY)
+    except orjson.JSONEncodeError:
+        return False
+    return True
+
+
+class _Tensor:
+    def __init__(self, name, array):
+        self.name = name
+        self.array = array
+
+    def as_numpy(self):
+        return self.array
+
+
+class _InferenceResponse:
+    def __init__(self, output_tensors=None, error=None):
+        self.output_tensors = output_tensors
+        self.error = error
+
+
+class _TritonError:
+    def __init__(self, message):
+        self.message = message
+
+
+class _Request:
+    def __init__(self, **inputs):
+        self.inputs = {name: _Tensor(name, array) for name, array in inputs.items()}
+
+
+class _Elasticsearch:
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def msearch(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.result
+
+
+@pytest.fixture
+def model(monkeypatch):
+    # Stand-in for the module the Triton python backend provides at runtime
+    pb_utils = types.ModuleType("triton_python_backend_utils")
+    pb_utils.Tensor = _Tensor
+    pb_utils.InferenceResponse = _InferenceResponse
+    pb_utils.TritonError = _TritonError
+    pb_utils.get_input_tensor_by_name = lambda request, name: request.inputs.get(name)
+    monkeypatch.setitem(sys.modules, "triton_python_backend_utils", pb_utils)
+
+    spec = importlib.util.spec_from_file_location("es_fetcher_model", MODEL_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    model = module.TritonPythonModel()
+    model.initialize({})
+    return model
+
+
+def _request(k, vector):
+    return _Request(
+        ElasticsearchQuery=np.array([b"{}"], dtype=np.object_),
+        K=np.array([k], dtype=np.int32),
+        Embedding=vector.reshape(1, -1),
+    )
+
+
+def _hit(job_id, score):
+    title = f"Job {job_id}"
+    return {"_source": {"title": title, "source_url": f"https://x/{job_id}"}, "_score": score}
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        np.float32,
+        pytest.param(
+            np.float16,
+            marks=pytest.mark.skipif(
+                not _orjson_serializes_float16(), reason="orjson without float16 support"
+            ),
+        ),
+    ],
+)
+def test_execute_maps_requests_to_one_msearch_and_back(model, dtype):
+    vectors = [np.full(2560, value, dtype=dtype) for value in (0.25, 0.5, 0.75, 1.0)]
+    model.es = _Elasticsearch(
+        {
+            "responses": [
+                {"hits": {"hits": [_hit("1", 0.9), _hit("2", 0.8)]}, "status": 200},
+                # filter_path leaves only the status of a search without hits
+                {"status": 200},
+                {"error": {"reason": "index closed"}, "status": 400},
+            ]
+        }
+    )
+    requests = [
+        _request(2, vectors[0]),
+        _Request(K=np.array([3], dtype=np.int32)),
+        _request(5, vectors[2]),
+        _request(1, vectors[3]),
+    ]
+
+    responses = model.execute(requests)
+
+    (call,) = model.es.calls
+    assert call["index"] == "jobs-json-embedding"
+    assert call["filter_path"] == FILTER_PATH
+    headers, bodies = call["searches"][::2], call["searches"][1::2]
+    assert headers == [b"{}"] * 3
+    for body, k, vector in zip(bodies, [2, 5, 1], [vectors[0], vectors[2], vectors[3]]):
+        search = orjson.loads(body)
+        assert search["size"] == k
+        knn = search["query"]["knn"]
+        assert knn["k"] == k
+        assert knn["field"] == "qwen3_embedding"
+        assert knn["query_vector"] == vector.tolist()
+        assert search["_source"] == {"excludes": ["qwen3_embedding"]}
+
+    assert len(responses) == len(requests)
+    jobs = [orjson.loads(job) for job in responses[0].output_tensors[0].as_numpy()]
+    assert [(job["title"], job["url"], job["score"]) for job in jobs] == [
+        ("Job 1", "https://x/1", 0.9),
+        ("Job 2", "https://x/2", 0.8),
+    ]
+    assert responses[1].error.message == "Missing 'Embedding' input."
+    assert responses[2].error.message == "No matching jobs found."
+    assert responses[3].error.message == "index closed"
+
+
+@pytest.mark.parametrize(
+    "result, returned",
+    [
+        # filter_path turns a batch without any hits or errors into an empty object
+        ({}, 0),
+        ({"responses": [{"status": 200}]}, 1),
+    ],
+)
+def test_execute_fails_every_search_when_results_do_not_line_up(model, result, returned):
+    model.es = _Elasticsearch(result)
+    vector = np.ones(2560, dtype=np.float32)
+
+    responses = model.execute([_request(3, vector), _request(3, vector)])
+
+    message = f"Elasticsearch returned {returned} results for 2 searches."
+    assert [response.error.message for response in responses] == [message, message]
+
+
+def test_execute_skips_msearch_when_no_request_can_be_searched(model):
+    model.es = _Elasticsearch({})
+
+    responses = model.execute([_Request(K=np.array([3], dtype=np.int32))])
+
+    assert model.es.calls == []
+    assert responses[0].error.message == "Missing 'Embedding' input."
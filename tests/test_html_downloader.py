@@ -0,0 +1,65 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from semantix.crawler.html_downloader import HTMLDownloader
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = f"<html><body>{self.path}</body></html>".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _write_source(path, base_url, job_ids):
+    jobs = [{"job_id": job_id, "url": f"{base_url}/details/{job_id}"} for job_id in job_ids]
+    path.write_text(json.dumps({"jobs": jobs}), encoding="utf-8")
+    return str(path)
+
+
+def test_process_urls_from_json_twice_on_one_downloader(tmp_path, server_url):
+    downloader = HTMLDownloader(str(tmp_path / "html"), delay=0.01, max_retries=0)
+
+    # Several URLs per host, so the second run has to wait on the host's token bucket
+    first = _write_source(tmp_path / "first.json", server_url, ["a1", "a2", "a3"])
+    second = _write_source(tmp_path / "second.json", server_url, ["b1", "b2", "b3"])
+    downloader.process_urls_from_json(first)
+    downloader.process_urls_from_json(second)
+
+    for job_id in ["a1", "a2", "a3", "b1", "b2", "b3"]:
+        url = f"{server_url}/details/{job_id}"
+        page = tmp_path / "html" / downloader.sanitize_filename(url, job_id)
+        assert page.read_text(encoding="utf-8") == f"<html><body>/details/{job_id}</body></html>"
+
+
+def test_pages_saved_under_the_legacy_name_are_not_downloaded_again(tmp_path, server_url):
+    downloader = HTMLDownloader(str(tmp_path / "html"), delay=0, max_retries=0)
+    url = f"{server_url}/details/200"
+    legacy_page = tmp_path / "html" / "200__details_200.html"
+    legacy_page.write_text("<html>saved earlier</html>", encoding="utf-8")
+
+    source = tmp_path / "jobs.json"
+    source.write_text(json.dumps({"jobs": [{"job_id": "200", "url": url}]}), encoding="utf-8")
+    downloader.process_urls_from_json(str(source))
+
+    assert legacy_page.read_text(encoding="utf-8") == "<html>saved earlier</html>"
+    assert not (tmp_path / "html" / downloader.sanitize_filename(url, "200")).exists()
@@ -0,0 +1,132 @@
+import json
+
+import pytest
+from bs4 import BeautifulSoup
+
+from semantix.processor.job_html_extractor import HTMLJobExtractor, SelectorAnchorFilter
+from tests import TESTS_DIR
+
+PATTERN_YAML = TESTS_DIR.parent / "src" / "yaml" / "apple_pattern.yaml"
+
+PAGE = """<!DOCTYPE html>
+<html lang="en-us">
+<head>
+  <title>Senior Software Engineer - Jobs - Careers at Apple</title>
+  <meta property="og:url"
+        content="https://jobs.apple.com/en-us/details/200600000/senior-software-engineer?team=SFTWR">
+  <meta property="og:title" content="Senior Software Engineer">
+  <script>window.analytics = {"title": "not the title"};</script>
+</head>
+<body>
+  <nav class="globalnav"><a href="/en-us/search">Search jobs</a> Careers at Apple</nav>
+  <main>
+    <section class="jobdetails">
+      <h1>Senior Software Engineer</h1>
+      <div id="jobdetails-jobnumber">200600000</div>
+      <time id="jobdetails-jobpostdate" datetime="2025-07-01">Jul 01, 2025</time>
+      <div id="jobdetails-joblocation">Cupertino, California, United States</div>
+      <div id="jobdetails-jobdetails-jobsummary-content-row">
+        <span>Build distributed Python services with a small, senior team.</span>
+      </div>
+      <div id="jobdetails-jobdetails-jobdescription-content-row">
+        <span>Design, build and operate services on AWS with Docker and Kubernetes.</span>
+        <span>Mentor engineers and lead design reviews.</span>
+      </div>
+      <div id="jobdetails-jobdetails-minimumqualifications-content-row">
+        <ul>
+          <li>5+ years of experience with Python and Swift</li>
+          <li>Strong communication skills and problem solving</li>
+        </ul>
+      </div>
+      <div id="jobdetails-jobdetails-preferredqualifications-content-row">
+        <ul><li>Machine learning experience with PyTorch</li></ul>
+      </div>
+      <div id="jobdetails-jobdetails-postingsupplementfooter-0-content-row">
+        <span>The base pay range for this role is between $143,100 and $264,200.</span>
+      </div>
+      <a id="jobdetails-jobdetails-jobdetailfooter-actions-jobdetailssubmitresume"
+         href="/app/en-us/apply/200600000">Submit Resume</a>
+    </section>
+  </main>
+  <footer><p>Copyright Apple Inc. Full-time and part-time roles.</p></footer>
+</body>
+</html>
+"""
+
+
+def _extract(extractor, content):
+    posting = extractor.extract_job_posting(content, filename="200600000.html")
+    data = posting.to_dict()
+    data.pop("scraped_date")
+    return data
+
+
+@pytest.mark.parametrize("content", [PAGE, PAGE.encode("utf-8")])
+def test_filtered_parse_matches_full_parse(content):
+    extractor = HTMLJobExtractor(str(PATTERN_YAML))
+    assert extractor._strainer is not None
+
+    filtered = _extract(extractor, content)
+    extractor._strainer = None
+    full = _extract(extractor, content)
+
+    assert filtered == full
+    assert filtered["job_id"] == "200600000"
+    assert filtered["minimum_qualifications"] == [
+        "5+ years of experience with Python and Swift",
+        "Strong communication skills and problem solving",
+    ]
+
+
+def test_filter_keeps_every_element_the_selectors_match():
+    selectors = [
+        "title",
+        'meta[property="og:url"]',
+        "#jobdetails-jobdetails-jobdescription-content-row span",
+        "section.jobdetails > h1",
+        "[datetime]",
+        "#jobdetails-jobdetails-minimumqualifications-content-row li",
+    ]
+    strainer = SelectorAnchorFilter.from_selectors(selectors)
+    filtered = BeautifulSoup(PAGE, "lxml", parse_only=strainer)
+    full = BeautifulSoup(PAGE, "lxml")
+
+    for selector in selectors:
+        expected = [str(element) for element in full.select(selector)]
+        assert expected
+        assert [str(element) for element in filtered.select(selector)] == expected
+
+
+@pytest.mark.parametrize(
+    "selector", ["h1 + div", "li:first-child", "h1 ~ time", "*", "div, p::text"]
+)
+def test_filter_needs_the_full_document_for_context_dependent_selectors(selector):
+    assert SelectorAnchorFilter.from_selectors(["title", selector]) is None
+
+
+def _extract_dir(tmp_path, html_dir, max_workers):
+    json_dir = tmp_path / f"json_{max_workers}"
+    HTMLJobExtractor(str(PATTERN_YAML)).process_html_files(
+        str(html_dir), str(json_dir), max_workers=max_workers
+    )
+    outputs = {}
+    for json_file in sorted(json_dir.glob("*.json")):
+        data = json.loads(json_file.read_text(encoding="utf-8"))
+        data.pop("scraped_date")
+        outputs[json_file.name] = data
+    return outputs
+
+
+def test_process_pool_matches_in_process_extraction(tmp_path):
+    html_dir = tmp_path / "html"
+    html_dir.mkdir()
+    for job_id in ("200600000", "200600001", "200600002"):
+        (html_dir / f"{job_id}.html").write_text(PAGE.replace("200600000", job_id))
+    (html_dir / "empty.html").write_text("<html><body></body></html>")
+
+    in_process = _extract_dir(tmp_path, html_dir, max_workers=1)
+    pooled = _extract_dir(tmp_path, html_dir, max_workers=2)
+
+    assert sorted(in_process) == ["200600000.json", "200600001.json", "200600002.json"]
+    assert pooled == in_process
+    assert in_process["200600001.json"]["job_id"] == "200600001"
@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from semantix.models.job_posting import ExperienceLevel, JobPosting, JobType, WorkArrangement
+
+
+def _posting():
+    return JobPosting(
+        job_id="200589590",
+        title="Software Engineer, Café Services",
+        company="Apple",
+        city="Cupertino",
+        work_arrangement=WorkArrangement.HYBRID,
+        job_type=JobType.FULL_TIME,
+        experience_level=ExperienceLevel.SENIOR_LEVEL,
+        salary_min=143100.0,
+        salary_max=264200.5,
+        required_skills=["python", "swift"],
+        minimum_qualifications=["5+ years of experience"],
+        visa_sponsorship=None,
+        relocation_assistance=True,
+        metadata={"source": {"pattern": "apple", "version": 2}, "tags": ["ai", "ml"]},
+    )
+
+
+def test_json_round_trip():
+    posting = _posting()
+
+    assert JobPosting.from_json(posting.to_json()) == posting
+    assert JobPosting.from_json(posting.to_json(indent=2)) == posting
+
+
+def test_to_json_matches_to_dict():
+    posting = _posting()
+
+    # Same document json.dumps(to_dict(), ensure_ascii=False) used to write
+    assert json.loads(posting.to_json()) == posting.to_dict()
+    assert posting.to_json(indent=2) == json.dumps(posting.to_dict(), indent=2, ensure_ascii=False)
+
+
+def test_save_and_load_file_round_trip(tmp_path):
+    posting = _posting()
+    path = tmp_path / "posting.json"
+
+    posting.save_to_file(str(path))
+
+    assert "Café" in path.read_text(encoding="utf-8")
+    assert JobPosting.load_from_file(str(path)) == posting
+
+
+def _job(job_id):
+    return {"job_id": job_id, "title": f"Engineer {job_id}", "company": "Apple"}
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        json.dumps([_job("1"), _job("2")]),
+        json.dumps({"jobs": [_job("1"), _job("2")], "total": 2}),
+        # Whitespace before the document that does not fit into a single read
+        "\n" * 100 + "  " * 40 + json.dumps([_job("1"), _job("2")]),
+        "\n" * 100 + json.dumps({"jobs": [_job("1"), _job("2")]}),
+    ],
+)
+def test_load_multiple_from_file(tmp_path, document):
+    path = tmp_path / "jobs.json"
+    path.write_text(document, encoding="utf-8")
+
+    jobs = JobPosting.load_multiple_from_file(str(path))
+
+    assert [job.job_id for job in jobs] == ["1", "2"]
+    assert jobs[1].title == "Engineer 2"
+
+
+def test_load_multiple_from_file_with_empty_jobs(tmp_path):
+    path = tmp_path / "jobs.json"
+    path.write_text(json.dumps({"jobs": []}), encoding="utf-8")
+
+    assert JobPosting.load_multiple_from_file(str(path)) == []
+
+
+@pytest.mark.parametrize("document", ['{"postings": []}', '"jobs"'])
+def test_load_multiple_from_file_rejects_other_documents(tmp_path, document):
+    path = tmp_path / "jobs.json"
+    path.write_text(document, encoding="utf-8")
+
+    with pytest.raises(ValueError, match="JSON file must contain"):
+        JobPosting.load_multiple_from_file(str(path))
+
+
+def test_to_json_with_non_str_metadata_keys(tmp_path):
+    posting = _posting()
+    posting.metadata = {"page": {1: "first", 2.5: "half"}, True: None}
+
+    assert (
+        json.loads(posting.to_json())["metadata"]
+        == json.loads(json.dumps(posting.to_dict()))["metadata"]
+    )
+    path = tmp_path / "posting.json"
+    posting.save_to_file(str(path))
+    assert JobPosting.load_from_file(str(path)).metadata == {
+        "page": {"1": "first", "2.5": "half"},
+        "true": None,
+    }
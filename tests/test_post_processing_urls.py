@@ -0,0 +1,75 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from semantix.crawler.post_processing_urls import load_pattern_config, main, process_jobs
+from tests import TESTS_DIR
+
+PATTERN_YAML = TESTS_DIR.parent / "src" / "yaml" / "apple_pattern.yaml"
+APPLE_DETAILS = "https://jobs.apple.com/en-us/details"
+
+
+def _input_data():
+    jobs = [
+        {"url": f"{APPLE_DETAILS}/200589590/software-engineer?team=SFTWR", "title": "SWE"},
+        {"url": "https://jobs.apple.com/en-us/search/locationPicker"},
+        {"url": f"{APPLE_DETAILS}/200600001/ml-researcher", "location": "Cupertino"},
+        # Same job ID as the first entry
+        {"url": f"{APPLE_DETAILS}/200589590/software-engineer?team=MLAI"},
+        {"url": f"{APPLE_DETAILS}/200600002/data-scientist", "metadata": {"page": 2}},
+        {"title": "No URL"},
+    ]
+    return {
+        "source_url": "https://jobs.apple.com/en-us/search",
+        "company_name": "Apple",
+        "jobs": jobs,
+        "total_pages_crawled": 3,
+    }
+
+
+def _run(url_file, output_file, *extra_args):
+    return CliRunner().invoke(
+        main,
+        [
+            "--url-file",
+            str(url_file),
+            "--output-file",
+            str(output_file),
+            "--pattern-yaml",
+            str(PATTERN_YAML),
+            *extra_args,
+        ],
+    )
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_streamed_output_matches_in_memory_output(tmp_path, workers):
+    url_file = tmp_path / "jobs.json"
+    url_file.write_text(json.dumps(_input_data()), encoding="utf-8")
+    output_file = tmp_path / "out" / "processed.json"
+
+    result = _run(url_file, output_file, "--workers", workers)
+
+    assert result.exit_code == 0, result.output
+    streamed = json.loads(output_file.read_text(encoding="utf-8"))
+    validation_config = load_pattern_config(PATTERN_YAML)["url_validation"]
+    in_memory = process_jobs(_input_data(), validation_config)
+    for output in (streamed, in_memory):
+        output.pop("processing_timestamp")
+    assert streamed == in_memory
+    assert [job["job_id"] for job in streamed["jobs"]] == ["200589590", "200600001", "200600002"]
+    assert streamed["processing_stats"]["duplicate_count"] == 1
+
+
+def test_failed_run_leaves_previous_output_untouched(tmp_path):
+    url_file = tmp_path / "jobs.json"
+    url_file.write_text('{"jobs": [{"url": "' + APPLE_DETAILS + '/1/a"}, {"url": ', "utf-8")
+    output_file = tmp_path / "processed.json"
+    output_file.write_text('{"jobs": []}', encoding="utf-8")
+
+    result = _run(url_file, output_file)
+
+    assert result.exit_code == 1
+    assert output_file.read_text(encoding="utf-8") == '{"jobs": []}'
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["jobs.json", "processed.json"]
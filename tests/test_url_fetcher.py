@@ -0,0 +1,55 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from semantix.crawler.url_fetcher import JobItem, JobsJsonPipeline
+
+
+def _spider(existing_jobs=()):
+    return SimpleNamespace(
+        existing_jobs=list(existing_jobs),
+        home_url="https://jobs.example.com",
+        pattern_config={"company_name": "Example"},
+        jobs_count=0,
+        pages_crawled=2,
+        total_pages=None,
+    )
+
+
+@pytest.mark.parametrize(
+    "existing_jobs", [[], [{"url": "https://jobs.example.com/1", "title": "Café Lead"}]]
+)
+def test_pipeline_writes_summary_then_streamed_jobs(tmp_path, existing_jobs):
+    output_file = tmp_path / "out" / "jobs.json"
+    pipeline = JobsJsonPipeline(str(output_file))
+    spider = _spider(existing_jobs)
+    pipeline.open_spider(spider)
+
+    new_jobs = [
+        {"url": "https://jobs.example.com/2", "title": "Engineer", "metadata": {"team": "ML"}}
+    ]
+    for job_data in new_jobs:
+        pipeline.process_item(JobItem(**job_data), spider)
+    spider.jobs_count = len(existing_jobs) + len(new_jobs)
+    pipeline.close_spider(spider)
+
+    data = json.loads(output_file.read_text(encoding="utf-8"))
+    jobs = data.pop("jobs")
+    assert jobs == existing_jobs + new_jobs
+    assert data == spider.extraction_summary
+    assert list(data)[:2] == ["source_url", "company_name"]
+    assert data["total_pages_attempted"] == "unknown"
+    assert not output_file.with_suffix(".json.part").exists()
+    # The JSON Lines stream stays behind for a restarted crawl
+    assert output_file.with_suffix(".jsonl").exists()
+
+
+def test_pipeline_writes_empty_jobs_array(tmp_path):
+    output_file = tmp_path / "jobs.json"
+    pipeline = JobsJsonPipeline(str(output_file))
+    spider = _spider()
+    pipeline.open_spider(spider)
+    pipeline.close_spider(spider)
+
+    assert json.loads(output_file.read_text(encoding="utf-8"))["jobs"] == []
@@ -1,7 +1,8 @@
-import json
 import numpy as np
+import orjson
 import triton_python_backend_utils as pb_utils
 from elasticsearch import Elasticsearch
+from elasticsearch.serializer import OrjsonSerializer
 
 class TritonPythonModel:
     """Your Python model must inherit from TritonPythonModel to be
@@ -9,12 +10,22 @@ class TritonPythonModel:
     """
 
     def initialize(self, args):
-        self.es=Elasticsearch("http://elasticsearch:9200", request_timeout=60)
+        # gzip the msearch body, which is mostly the query vectors written out as JSON,
+        # and parse the hits with orjson
+        self.es=Elasticsearch("http://elasticsearch:9200",
+                              serializer=OrjsonSerializer(),
+                              request_timeout=60,
+                              http_compress=True,
+                              retry_on_timeout=True,
+                              max_retries=2)
         self.index_name="jobs-json-embedding"
 
     def execute(self, requests):
 
-        responses = []
+        # One kNN search per request, all sent to Elasticsearch in a single msearch round-trip.
+        # `errors` keeps one entry per request: None if it was searched, else why it failed.
+        searches = []
+        errors = []
 
         for request in requests:
             # Get input tensors
@@ -24,9 +35,11 @@ class TritonPythonModel:
 
             # Validate inputs
             if k_tensor is None:
-                return pb_utils.TritonError("Missing 'K' input.")
+                errors.append("Missing 'K' input.")
+                continue
             if embedding_tensor is None:
-                return pb_utils.TritonError("Missing 'Embedding' input.")
+                errors.append("Missing 'Embedding' input.")
+                continue
 
             # Decode inputs
             # es_queries = es_query_tensor.as_numpy().tolist()
@@ -34,30 +47,73 @@ class TritonPythonModel:
             embeddings = embedding_tensor.as_numpy()
             query = {"knn": {
                         "field": "qwen3_embedding", 
-                        "query_vector": embeddings[0].tolist(), 
+                        "query_vector": embeddings[0], 
                         "k": ks[0]
                         }
                     }
-            response = self.es.search(index=self.index_name, 
-                                        size=ks[0],
-                                        body={"query": query}
-                                    )
-            if response['hits']['hits']:
+            # msearch lines are encoded here so orjson writes the vector straight from the
+            # ndarray, without building 2560 Python floats; the client sends bytes lines as-is
+            searches.append(b"{}")
+            # Leave the 2560-float vector out of every hit on the server side
+            searches.append(orjson.dumps({"query": query, "size": ks[0],
+                                          "_source": {"excludes": ["qwen3_embedding"]}},
+                                         option=orjson.OPT_SERIALIZE_NUMPY))
+            errors.append(None)
+
+        if not searches:
+            return [pb_utils.InferenceResponse(error=pb_utils.TritonError(error))
+                    for error in errors]
+
+        # filter_path drops everything but the hits' source and score (and any per-search error).
+        # It also drops elements that end up empty, so `status` is kept to leave one element
+        # per search, including searches that matched nothing.
+        results = self.es.msearch(index=self.index_name, searches=searches,
+                                  filter_path=["responses.hits.hits._source",
+                                               "responses.hits.hits._score",
+                                               "responses.error",
+                                               "responses.status"])
+        search_responses = results.get('responses', [])
+        searched = len(searches) // 2
+        if len(search_responses) != searched:
+            # Without one result per search there is no safe way to match results to requests
+            message = (f"Elasticsearch returned {len(search_responses)} results "
+                       f"for {searched} searches.")
+            search_responses = [{'error': {'reason': message}}] * searched
+
+        responses = []
+
+        # msearch answers in the order the searches were sent, so results line up with the
+        # requests that were searched; every request gets exactly one response
+        search_results = iter(search_responses)
+        for error in errors:
+            if error is not None:
+                responses.append(pb_utils.InferenceResponse(error=pb_utils.TritonError(error)))
+                continue
+
+            response = next(search_results)
+            if 'error' in response:
+                reason = response['error'].get('reason', 'Elasticsearch search failed.')
+                responses.append(pb_utils.InferenceResponse(error=pb_utils.TritonError(reason)))
+                continue
+
+            # filter_path omits `hits` from the element when a search matched nothing
+            if response.get('hits', {}).get('hits'):
                 jobs_found=[]
-                jobs=[]
                 for file in response['hits']['hits']:
                     info = file['_source']
                     score = file['_score']
-                    del info['qwen3_embedding']
-                    jobs_found.append(json.dumps({'title':info['title'],
+                    # Each hit goes out as UTF-8 JSON bytes, which a TYPE_STRING tensor holds as-is
+                    jobs_found.append(orjson.dumps({'title':info['title'],
                                         'url':info['source_url'],
                                         'job': info,
                                         'score':score}))
             else:
-                return ValueError
-            
+                responses.append(pb_utils.InferenceResponse(
+                    error=pb_utils.TritonError("No matching jobs found.")))
+                continue
+
             output_tensor = pb_utils.Tensor("Responses",np.array(jobs_found, dtype=np.object_))
-        responses.append(pb_utils.InferenceResponse(output_tensors=[output_tensor]))
+            responses.append(pb_utils.InferenceResponse(output_tensors=[output_tensor]))
         return responses
 
     def finalize(self):
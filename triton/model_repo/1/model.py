@@ -1,68 +1,128 @@
 import triton_python_backend_utils as pb_utils
+import hashlib
 import json
+from collections import OrderedDict
 import numpy as np
 import torch
 from transformers import AutoTokenizer, AutoModel
 import torch.nn.functional as F
 
+# Number of query embeddings kept in memory so repeated texts skip the forward pass
+EMBEDDING_CACHE_SIZE = 1024
+
 class TritonPythonModel:
     """Your Python model must inherit from `TritonPythonModel`."""
 
     def initialize(self, args):
         """`initialize` is called once when the model is loaded."""
         model_config = json.loads(args['model_config'])
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        # Each KIND_GPU instance runs in its own process on the GPU Triton assigned it
+        if torch.cuda.is_available():
+            self.device = torch.device(f"cuda:{args['model_instance_device_id']}")
+        else:
+            self.device = torch.device("cpu")
 
         self.tokenizer = AutoTokenizer.from_pretrained("/models/Qwen3-Embedding-4B", trust_remote_code=True)
         self.model = AutoModel.from_pretrained("/models/Qwen3-Embedding-4B",
-                                               device_map="auto",
+                                               device_map=self.device,
                                                torch_dtype=torch.float16,
                                                trust_remote_code=True)
         
         self.model.eval() # Set model to evaluation mode
         self.model.to(self.device)
-    
+
+        # blake2b digest of the UTF-8 query -> FP16 embedding, least recently used first
+        self.embedding_cache = OrderedDict()
+
+        # Row indices for the last-token gather, allocated once for the largest
+        # batch Triton sends
+        self.batch_indices = torch.arange(max(model_config['max_batch_size'], 1),
+                                          device=self.device)
+
+    def _embed(self, input_texts):
+        """Run the tokenizer and model on `input_texts` and return their last-token embeddings."""
+        # The last-token pooling below assumes right padding, so don't rely on the
+        # padding side configured for the tokenizer
+        input_encoded = self.tokenizer(input_texts, padding=True, padding_side="right",
+                                       truncation=True,
+                                       max_length=self.tokenizer.model_max_length,
+                                       return_tensors="pt").to(self.device)
+
+        with torch.no_grad():
+            outputs = self.model(**input_encoded)
+
+        # --- Last-Token Pooling Logic ---
+        # Get the last hidden state of the model.
+        # It stays in the model's FP16; upcasting would copy every token, not just the pooled ones.
+        last_hidden_state = outputs.last_hidden_state
+
+        # Find the position of the last non-padding token for each sequence in the batch.
+        # `attention_mask` is a tensor of 1s (for real tokens) and 0s (for padding).
+        attention_mask = input_encoded['attention_mask']
+
+        # Get the index of the last non-padding token
+        # torch.sum() along dimension 1 gives the number of real tokens for each sequence.
+        # Subtracting 1 gives the index of the last token (since indexing is 0-based).
+        last_token_indices = torch.sum(attention_mask, dim=1).sub_(1)
+
+        # Use advanced indexing to get the hidden state of the last token for each sequence
+        # `batch_indices` is [0, 1, 2, ...], one entry per sequence in the batch dimension.
+        batch_size = last_hidden_state.shape[0]
+        if batch_size <= len(self.batch_indices):
+            batch_indices = self.batch_indices[:batch_size]
+        else:
+            batch_indices = torch.arange(batch_size, device=last_hidden_state.device)
+        last_token_embeddings = last_hidden_state[batch_indices, last_token_indices, :]
+        return last_token_embeddings.detach().cpu().numpy()
 
     def execute(self, requests):
         """`execute` is called by the Triton Inference Server for every inference request."""
-        responses = []
+        # Collect every request's texts first so all cache misses share one forward pass.
+        # `request_keys` keeps one entry per request: its text keys, or None if it failed.
+        request_keys = []
+        embeddings = {}
+        missing = {}
         for request in requests:
             # Get the input tensor
             input_texts_tensor = pb_utils.get_input_tensor_by_name(request, "Query")
             if input_texts_tensor is None:
-                return pb_utils.TritonError("Input tensor 'Query' not found.")
-
-            # Decode bytes to strings
-            input_texts = [t.decode('utf-8') for t in input_texts_tensor.as_numpy().flatten()]
+                request_keys.append(None)
+                continue
 
-            input_encoded = self.tokenizer(input_texts, padding=True, truncation=True, 
-                                         max_length=self.tokenizer.model_max_length, return_tensors="pt",
-                                         ).to(self.device)
+            raw_texts = input_texts_tensor.as_numpy().flatten()
+            keys = [hashlib.blake2b(t, digest_size=16).digest() for t in raw_texts]
+            request_keys.append(keys)
 
-            with torch.no_grad():
-                outputs = self.model(**input_encoded)
+            # Reuse cached embeddings, and only send unseen texts through the model
+            for key, text in zip(keys, raw_texts):
+                if key in embeddings or key in missing:
+                    continue
+                cached = self.embedding_cache.get(key)
+                if cached is not None:
+                    self.embedding_cache.move_to_end(key)
+                    embeddings[key] = cached
+                else:
+                    missing[key] = text.decode('utf-8')
 
-            # --- Last-Token Pooling Logic ---
-            # Get the last hidden state of the model.
-            last_hidden_state = outputs.last_hidden_state.to(torch.float32)
+        if missing:
+            computed = self._embed(list(missing.values()))
+            for key, embedding in zip(missing, computed):
+                embeddings[key] = embedding
+                self.embedding_cache[key] = embedding
+            while len(self.embedding_cache) > EMBEDDING_CACHE_SIZE:
+                self.embedding_cache.popitem(last=False)
 
-            # Find the position of the last non-padding token for each sequence in the batch.
-            # `attention_mask` is a tensor of 1s (for real tokens) and 0s (for padding).
-            attention_mask = input_encoded['attention_mask']
-
-            # Get the index of the last non-padding token
-            # torch.sum() along dimension 1 gives the number of real tokens for each sequence.
-            # Subtracting 1 gives the index of the last token (since indexing is 0-based).
-            last_token_indices = torch.sum(attention_mask, dim=1) - 1
-
-            # Use advanced indexing to get the hidden state of the last token for each sequence
-            # `torch.arange(last_hidden_state.shape[0])` creates a tensor [0, 1, 2, ...]
-            # which corresponds to the batch dimension.
-            batch_indices = torch.arange(last_hidden_state.shape[0])
-            last_token_embeddings = last_hidden_state[batch_indices, last_token_indices, :]
+        responses = []
+        for keys in request_keys:
+            if keys is None:
+                # Fail only this request; the rest of the batch still gets its embeddings
+                responses.append(pb_utils.InferenceResponse(
+                    error=pb_utils.TritonError("Input tensor 'Query' not found.")))
+                continue
 
             # Create a Triton output tensor
-            output_tensor = pb_utils.Tensor('Embedding', last_token_embeddings.detach().cpu().numpy())
+            output_tensor = pb_utils.Tensor('Embedding',
+                                            np.stack([embeddings[key] for key in keys]))
 
             # Create the inference response
             response = pb_utils.InferenceResponse(output_tensors=[output_tensor])